@@ -1,16 +1,84 @@
 """Advent of Code 2024 utility functions."""
 
-import time
-from typing import Any, Callable
+import mmap
+import os
+from contextlib import nullcontext
+from typing import Any, Callable, Iterator
+
+from aoc.benchmark import BenchmarkResult, StageResult, measure_stage
+from aoc.cache import InputCache, cache_key, is_cacheable
+from aoc.lazy import lazy_import
+from aoc.profiling import format_profile, profile_file_name, profile_to
+from aoc.progress import enabled, has_queue
+from aoc.shared import copy_data, read_only
+
+futures = lazy_import("concurrent.futures")
+
+
+def read_lines(file_name: str) -> list[str]:
+    """Read lines from a file and strip line ends."""
+    with open(file_name) as file_object:
+        return [line.rstrip() for line in file_object]
+
+
+def parse_lines(lines: list[str], line_parser: Callable[[str], Any]) -> list[Any]:
+    """Parse each line."""
+    return [line_parser(line) for line in lines]
 
 
 def load_data(file_name: str, line_parser: Callable[[str], str] | None) -> list[str]:
     """Load lines from a file and strip line ends."""
+    lines = read_lines(file_name)
+    return parse_lines(lines, line_parser) if line_parser else lines
+
+
+def iter_data(
+    file_name: str,
+    line_parser: Callable[[str], Any] | None = None,
+) -> Iterator[Any]:
+    """Lazily load and parse lines from a file, stripping line ends."""
     with open(file_name) as file_object:
-        return [
-            line_parser(line.rstrip()) if line_parser else line.rstrip()
-            for line in file_object.readlines()
-        ]
+        for line in file_object:
+            yield line_parser(line.rstrip()) if line_parser else line.rstrip()
+
+
+def map_file(file_name: str) -> mmap.mmap | bytes:
+    """Memory map a file read only so the data is not copied onto the heap."""
+    with open(file_name, "rb") as file_object:
+        if os.fstat(file_object.fileno()).st_size == 0:
+            # empty files can't be mapped
+            return b""
+
+        return mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def check_runs(repeat: int, warmup: int) -> None:
+    """Check there is at least one timed run and no negative warmup runs."""
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, not {repeat}")
+
+    if warmup < 0:
+        raise ValueError(f"warmup can't be negative, not {warmup}")
+
+
+class FileChunks:
+    """Chunks of a file's bytes that can be iterated more than once."""
+
+    def __init__(self, file_name: str, chunk_bytes: int = 1 << 20) -> None:
+        """
+        Read a file a chunk at a time each time it's iterated.
+
+        file_name - file to read
+        chunk_bytes - size of each chunk, the last may be smaller
+        """
+        self.file_name = file_name
+        self.chunk_bytes = chunk_bytes
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Read the chunks."""
+        with open(self.file_name, "rb") as file_object:
+            while chunk := file_object.read(self.chunk_bytes):
+                yield chunk
 
 
 class Runner:
@@ -26,9 +94,21 @@ class Runner:
         split_data: bool = False,
         extra_args_1: list[Any] | None = None,
         extra_args_2: list[Any] | None = None,
+        expected_1: int | None = None,
+        expected_2: int | None = None,
         loader: Callable[[str], Any] | None = None,
         line_parser: Callable[[str], Any] | None = None,
         load_parser: Callable[[list[str]], Any] | None = None,
+        repeat: int = 1,
+        warmup: int = 0,
+        stages: bool = False,
+        trace_memory: bool = False,
+        quiet: bool = False,
+        cache: bool = False,
+        stream: bool = False,
+        memory_map: bool = False,
+        profile: int = 0,
+        prefetch: bool = True,
     ) -> None:
         """
         Run, test and output in a consistent manner.
@@ -40,11 +120,31 @@ class Runner:
         split_data - use different data for parts (1.txt and 2.txt)
         extra_args_1 - (optional) list of extra arguments to call function with
         extra_args_2 - (optional) list of extra arguments to call function with
+        expected_1 - (optional) expected part 1 result from the test data
+        expected_2 - (optional) expected part 2 result from the test data
         loader - (optional) function loads data from a file name
         line_parser - (optional) function that parses data from each line in the file
         load_parser - (optional) function that parses data from all lines in the file
+        repeat - number of timed runs of each function (benchmark mode if > 1)
+        warmup - number of untimed runs of each function before the timed runs
+        stages - output the time taken by each of the load, parse and solve stages
+        trace_memory - trace peak and net memory of each stage (slows the stages), the
+                       solver's on an extra untimed run
+        quiet - do not output results
+        cache - cache the loaded and parsed data on disk, keyed by the file contents
+                and the loading functions
+        stream - pass functions a lazy iterator of parsed lines instead of a list,
+                 for single pass functions on large inputs
+        memory_map - pass functions a read only memory map of the file, for large
+                     inputs used as a single blob of bytes
+        profile - profile an extra untimed run of each function with cProfile, saving
+                  the stats to profiles/dayNN-P[.test].pstats and outputting this
+                  many of the top functions by cumulative time
+        prefetch - load the proper data in a background thread while the test
+                   data is solved, unless streaming or tracing memory
 
-        line_parser and load_parser are unused if loader is provided
+        line_parser and load_parser are unused if loader is provided, and loader,
+        load_parser and cache are unused if stream or memory_map is set
         """
         self.day = day
         self.function = (function_1, function_2 if function_2 else function_1)
@@ -58,9 +158,24 @@ class Runner:
             self._file_name(False, False, split_data),
         )
         self.extra_args = (extra_args_1, extra_args_2)
+        self.expected = (expected_1, expected_2)
         self.loader = loader
         self.line_parser = line_parser
         self.load_parser = load_parser
+        check_runs(repeat, warmup)
+        self.repeat = repeat
+        self.warmup = warmup
+        self.stages = stages or trace_memory
+        self.trace_memory = trace_memory
+        self.quiet = quiet
+        self.cache = InputCache() if cache else None
+        self.stream = stream
+        self.memory_map = memory_map
+        self.profile = profile
+        self.prefetch = prefetch
+        self.loaded: dict[str, Any] = {}
+        self.prefetched: dict[str, tuple[Any, list[StageResult]]] = {}
+        self.executor: Any = None
 
     def _file_name(self, part_one: bool, test: bool, split: bool) -> str:
         mid_sep = "." if test or split else ""
@@ -68,49 +183,223 @@ class Runner:
         split_part = (1 if part_one else 2) if split else ""
         return f"data/day{self.day:02d}{mid_sep}{test_str}{split_part}.txt"
 
+    def _print(self, text: str, end: str = "\n") -> None:
+        if not self.quiet:
+            print(text, end=end)
+
+    def _load(self, file_name: str, stages: list[StageResult]) -> Any:
+        if self.stream:
+            with measure_stage(stages, "loader", self.trace_memory):
+                return iter_data(file_name, self.line_parser)
+
+        if self.memory_map:
+            with measure_stage(stages, "loader", self.trace_memory):
+                return map_file(file_name)
+
+        if self.cache is None or not is_cacheable(self.loader):
+            return self._load_file(file_name, stages)
+
+        with measure_stage(stages, "cache", self.trace_memory):
+            key = cache_key(
+                file_name,
+                [self.loader] if self.loader else [self.line_parser, self.load_parser],
+            )
+            cached, data = self.cache.load(key)
+        if cached:
+            return data
+
+        data = self._load_file(file_name, stages)
+        self.cache.store(key, data)
+        return data
+
+    def _load_file(self, file_name: str, stages: list[StageResult]) -> Any:
+        if self.loader:
+            with measure_stage(stages, "loader", self.trace_memory):
+                return self.loader(file_name)
+
+        with measure_stage(stages, "loader", self.trace_memory):
+            data = read_lines(file_name)
+        if self.line_parser:
+            with measure_stage(stages, "line_parser", self.trace_memory):
+                data = parse_lines(data, self.line_parser)
+        if self.load_parser:
+            with measure_stage(stages, "load_parser", self.trace_memory):
+                data = self.load_parser(data)
+
+        return data
+
+    def _prefetch(self, file_name: str) -> None:
+        if (
+            not self.prefetch
+            or self.stream
+            or self.trace_memory
+            or file_name in self.loaded
+            or file_name in self.prefetched
+        ):
+            return
+
+        if self.executor is None:
+            self.executor = futures.ThreadPoolExecutor(max_workers=1)
+        stages: list[StageResult] = []
+        future = self.executor.submit(self._load, file_name, stages)
+        self.prefetched[file_name] = (future, stages)
+
     def _run(
         self,
         part_one: bool = True,
         expected: int | None = None,
-    ) -> None:
+        repeat: int = 1,
+        warmup: int = 0,
+        file_name: str | None = None,
+    ) -> BenchmarkResult:
+        check_runs(repeat, warmup)
         part = 0 if part_one else 1
         test = expected is not None
         name = f"{self.day:02d}-{part + 1}"
-        file_name = self.file_name["test" if test else "proper"][part]
+        file_name = file_name or self.file_name["test" if test else "proper"][part]
 
-        if self.loader:
-            data = self.loader(file_name)
+        benchmark = BenchmarkResult(name, file_name, None, warmup)
+        if self.stream:
+            data = self._load(file_name, benchmark.stages)
         else:
-            data = load_data(file_name, self.line_parser)
-            if self.load_parser:
-                data = self.load_parser(data)
+            # load each file once and share it between the parts and runs
+            if file_name in self.prefetched:
+                future, stages = self.prefetched.pop(file_name)
+                self.loaded[file_name] = future.result()
+                benchmark.stages.extend(stages)
+            elif file_name not in self.loaded:
+                self.loaded[file_name] = self._load(file_name, benchmark.stages)
+            data = self.loaded[file_name]
+        if self.profile:
+            benchmark.profile = profile_file_name(name, test)
 
-        print(f"#### {name} ", end="")
-        start_time = time.time()
+        self._print(f"#### {name} ", end="")
         function = self.function[part]
-        extra_args = self.extra_args[part]
-        result = function(data, *extra_args) if extra_args else function(data)
-        time_elapsed = time.time() - start_time
+        mutates = getattr(function, "mutates_data", False)
+        extra_args = self.extra_args[part] or []
+        # progress would only slow down benchmarks, and quiet runners only
+        # report it to an aggregating process
+        show_progress = warmup + repeat == 1 and (not self.quiet or has_queue())
+        runs = warmup + repeat
+        # trace memory and profile on extra untimed runs so their overhead doesn't
+        # skew the times
+        extra_runs = [
+            extra
+            for extra, enable in (
+                ("trace", self.trace_memory),
+                ("profile", bool(benchmark.profile)),
+            )
+            if enable
+        ]
+        solver_stage = StageResult("solver")
+        for run_idx in range(runs + len(extra_runs)):
+            extra = extra_runs[run_idx - runs] if run_idx >= runs else None
+            if self.stream:
+                # an iterator is consumed by a run so each run needs a new one
+                run_data = iter_data(file_name, self.line_parser) if run_idx else data
+            else:
+                # solvers that modify their data get a copy, others a read only view
+                run_data = copy_data(data) if mutates else read_only(data)
+            with measure_stage([], "solver", extra == "trace") as stage:
+                with (
+                    enabled(show_progress and extra is None),
+                    profile_to(benchmark.profile)
+                    if extra == "profile"
+                    else nullcontext(),
+                ):
+                    result = function(run_data, *extra_args)
+            if extra is None:
+                solver_stage.time_ns = stage.time_ns
+                if run_idx >= warmup:
+                    benchmark.times_ns.append(stage.time_ns)
+            elif extra == "trace":
+                solver_stage.peak_bytes = stage.peak_bytes
+                solver_stage.net_bytes = stage.net_bytes
+
+        benchmark.stages.append(solver_stage)
+        benchmark.result = result
         expected_str = f" {expected=}" if expected else ""
-        print(f"time={time_elapsed*1000:.2f}ms{expected_str} {result=}")
+        self._print(f"{benchmark.summary()}{expected_str} {result=}")
+        if self.stages:
+            for stage in benchmark.stages:
+                self._print(f"     {stage.summary()}")
+        if benchmark.profile:
+            self._print(format_profile(benchmark.profile, self.profile))
         if expected is not None:
             if result != expected:
-                print(f"!!!! {result} != {expected}")
-                raise RuntimeError
+                self._print(f"!!!! {result} != {expected}")
+                raise RuntimeError(f"{name} {result} != {expected}")
+
+        return benchmark
 
     def _part(
         self,
         part_one: bool = True,
         expected: int | None = None,
-    ) -> None:
+        repeat: int | None = None,
+        warmup: int | None = None,
+        size: int | None = None,
+        seed: int = 0,
+    ) -> BenchmarkResult:
+        expected = self.expected[0 if part_one else 1] if expected is None else expected
+        repeat = self.repeat if repeat is None else repeat
+        warmup = self.warmup if warmup is None else warmup
+        file_name = self.file_name["proper"][0 if part_one else 1]
+        if size is not None:
+            # numpy is only needed when generating inputs
+            from aoc.generate import generate
+
+            file_name = generate(self.day, size, seed)
         if expected is not None:
-            self._run(part_one, expected)
-        self._run(part_one)
+            # load the proper data while the test data is solved
+            self._prefetch(file_name)
+            self._run(part_one, expected, repeat, warmup)
+
+        return self._run(part_one, None, repeat, warmup, file_name)
+
+    def solve(
+        self,
+        file_name: str,
+        part_one: bool = True,
+        *,
+        repeat: int | None = None,
+        warmup: int | None = None,
+    ) -> BenchmarkResult:
+        """Run a part on any input file, returning the timings."""
+        repeat = self.repeat if repeat is None else repeat
+        warmup = self.warmup if warmup is None else warmup
+        return self._run(part_one, None, repeat, warmup, file_name)
 
-    def part_1(self, expected: int | None = None) -> None:
-        """Run part 1 tasks."""
-        self._part(True, expected)
+    def part_1(
+        self,
+        expected: int | None = None,
+        *,
+        repeat: int | None = None,
+        warmup: int | None = None,
+        size: int | None = None,
+        seed: int = 0,
+    ) -> BenchmarkResult:
+        """
+        Run part 1 tasks, returning the timings of the proper run.
 
-    def part_2(self, expected: int | None = None) -> None:
-        """Run part 2 tasks."""
-        self._part(False, expected)
+        size - (optional) run on a generated input of this size instead of the data
+        seed - random seed of the generated input
+        """
+        return self._part(True, expected, repeat, warmup, size, seed)
+
+    def part_2(
+        self,
+        expected: int | None = None,
+        *,
+        repeat: int | None = None,
+        warmup: int | None = None,
+        size: int | None = None,
+        seed: int = 0,
+    ) -> BenchmarkResult:
+        """
+        Run part 2 tasks, returning the timings of the proper run.
+
+        size - (optional) run on a generated input of this size instead of the data
+        seed - random seed of the generated input
+        """
+        return self._part(False, expected, repeat, warmup, size, seed)
@@ -0,0 +1,148 @@
+"""Run many days in parallel and output a table of the results."""
+
+import argparse
+import json
+import sys
+import time
+
+from aoc.baseline import BASELINE_FILE, compare_baseline, load_baseline, save_baseline
+from aoc.profiling import format_profile
+from aoc.suite import find_days, format_table, parse_days, run_parts
+
+
+def main() -> int:
+    """Parse the arguments and run the selected day parts."""
+    parser = argparse.ArgumentParser(prog="python -m aoc", description=__doc__)
+    parser.add_argument("days", nargs="*", help="day numbers or ranges, e.g. 1-5 7")
+    parser.add_argument("-p", "--part", type=int, choices=(1, 2), action="append")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes")
+    parser.add_argument("-r", "--repeat", type=int, default=1)
+    parser.add_argument("-w", "--warmup", type=int, default=0)
+    parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        help="run on generated inputs of this size instead of the data",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="generated input seed")
+    parser.add_argument("--cache", action="store_true", help="cache parsed inputs")
+    parser.add_argument(
+        "--profile",
+        type=int,
+        default=0,
+        metavar="TOP",
+        help="profile the solvers, output the top functions by cumulative time",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="output the combined progress of the solvers that report it",
+    )
+    parser.add_argument("--json", metavar="FILE", help="write the results as JSON")
+    parser.add_argument(
+        "--save-baseline",
+        nargs="?",
+        const=BASELINE_FILE,
+        metavar="FILE",
+        help=f"save the results as a baseline (default {BASELINE_FILE})",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=BASELINE_FILE,
+        metavar="FILE",
+        help="compare the fastest solver times against a baseline and fail if slower",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed fractional slowdown against the baseline (default 0.25)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.1,
+        help="ignore slowdowns smaller than this (default 0.1)",
+    )
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.warmup < 0:
+        parser.error("--warmup can't be negative")
+
+    sys.path.insert(0, ".")
+    days = parse_days(args.days, find_days())
+    parts = args.part or [1, 2]
+
+    start_time = time.perf_counter()
+    part_results = []
+    for part_result in run_parts(
+        days,
+        parts,
+        args.jobs,
+        args.cache,
+        args.profile,
+        args.progress,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        size=args.size,
+        seed=args.seed,
+    ):
+        print(f"#### {part_result.name} {'FAIL' if part_result.error else 'done'}")
+        part_results.append(part_result)
+    time_elapsed = time.perf_counter() - start_time
+
+    for part_result in sorted(part_results, key=lambda val: (val.day, val.part)):
+        if part_result.benchmark and part_result.benchmark.profile:
+            print(f"#### {part_result.name} {part_result.benchmark.profile}")
+            print(format_profile(part_result.benchmark.profile, args.profile))
+
+    print(format_table(part_results))
+    print(f"{len(part_results)} parts in {time_elapsed:.2f}s")
+
+    if args.json:
+        with open(args.json, "w") as file_object:
+            json.dump(
+                [
+                    part_result.benchmark.to_dict()
+                    if part_result.benchmark
+                    else {"name": part_result.name, "error": part_result.error}
+                    for part_result in part_results
+                ],
+                file_object,
+                indent=2,
+            )
+
+    failed = any(part_result.error for part_result in part_results)
+    benchmarks = [
+        part_result.benchmark for part_result in part_results if part_result.benchmark
+    ]
+
+    if args.compare:
+        min_delta_ns = args.min_delta_ms * 1e6
+        comparisons = compare_baseline(load_baseline(args.compare), benchmarks)
+        for comparison in comparisons:
+            print(comparison.summary(args.threshold, min_delta_ns))
+
+        regressions = [
+            comparison.name
+            for comparison in comparisons
+            if comparison.regressed(args.threshold, min_delta_ns)
+        ]
+        if regressions:
+            print(f"!!!! regressions in {' '.join(regressions)}")
+            failed = True
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, benchmarks)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+
+    except KeyboardInterrupt:
+        pass
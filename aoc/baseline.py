@@ -0,0 +1,124 @@
+"""Stored benchmark baselines and regression checks."""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any
+
+from aoc.benchmark import BenchmarkResult
+
+BASELINE_FILE = "benchmarks/baseline.json"
+# slowdowns within this many times the gap between the baseline's fastest and
+# median runs are noise, which unlike the standard deviation isn't swayed by one
+# slow cold run
+NOISE_SPREADS = 2
+
+
+def baseline_key(name: str, file_name: str) -> str:
+    """Return the key of a part run on an input, e.g. a generated input's size."""
+    return f"{name} {file_name}"
+
+
+def save_baseline(file_name: str, benchmarks: list[BenchmarkResult]) -> None:
+    """Save benchmark results as a baseline, replacing only the parts that were run."""
+    baseline = load_baseline(file_name) if os.path.exists(file_name) else {}
+    baseline.update(
+        {
+            baseline_key(benchmark.name, benchmark.file_name): benchmark.to_dict()
+            for benchmark in benchmarks
+        },
+    )
+    baseline = dict(sorted(baseline.items()))
+
+    os.makedirs(os.path.dirname(file_name) or ".", exist_ok=True)
+    with open(file_name, "w") as file_object:
+        json.dump(baseline, file_object, indent=2)
+        file_object.write("\n")
+
+
+def load_baseline(file_name: str) -> dict[str, dict[str, Any]]:
+    """Load a baseline keyed by part name and input file."""
+    with open(file_name) as file_object:
+        baseline = json.load(file_object)
+
+    # older baselines were keyed by part name only
+    return {
+        baseline_key(part["name"], part["file_name"]): part
+        for part in baseline.values()
+    }
+
+
+@dataclass
+class Comparison:
+    """Comparison of a part's fastest solver time against its baseline."""
+
+    name: str
+    current_ns: float
+    baseline_ns: float | None = None
+    baseline_spread_ns: float = 0
+    result_changed: bool = False
+
+    @property
+    def ratio(self) -> float | None:
+        """Return the current time as a multiple of the baseline time."""
+        if self.baseline_ns is None:
+            return None
+
+        return self.current_ns / max(self.baseline_ns, 1)
+
+    def regressed(self, threshold: float, min_delta_ns: float = 0) -> bool:
+        """
+        Check if the part is slower than the baseline or its result has changed.
+
+        threshold - allowed fractional slowdown, e.g. 0.25 for 25% slower
+        min_delta_ns - ignore slowdowns smaller than this or NOISE_SPREADS times the
+                       baseline's spread, they are noise
+        """
+        if self.result_changed:
+            return True
+
+        if self.baseline_ns is None:
+            return False
+
+        noise_ns = max(min_delta_ns, NOISE_SPREADS * self.baseline_spread_ns)
+        return (
+            self.current_ns > self.baseline_ns * (1 + threshold)
+            and self.current_ns - self.baseline_ns > noise_ns
+        )
+
+    def summary(self, threshold: float, min_delta_ns: float = 0) -> str:
+        """Return a one line summary of the comparison."""
+        current_str = f"{self.current_ns / 1e6:.2f}ms"
+        if self.baseline_ns is None:
+            return f"{self.name} {current_str} (no baseline)"
+
+        status = "REGRESSED" if self.regressed(threshold, min_delta_ns) else "ok"
+        result_str = " result changed" if self.result_changed else ""
+        return (
+            f"{self.name} {current_str} baseline={self.baseline_ns / 1e6:.2f}ms"
+            f" x{self.ratio:.2f} {status}{result_str}"
+        )
+
+
+def compare_baseline(
+    baseline: dict[str, dict[str, Any]],
+    benchmarks: list[BenchmarkResult],
+) -> list[Comparison]:
+    """Compare benchmark results against the baseline of the same part and input."""
+    comparisons = []
+    for benchmark in sorted(benchmarks, key=lambda val: val.name):
+        # the fastest run is the least affected by other load on the machine
+        comparison = Comparison(benchmark.name, benchmark.min_ns)
+        key = baseline_key(benchmark.name, benchmark.file_name)
+        if key in baseline:
+            baseline_part = baseline[key]
+            comparison.baseline_ns = baseline_part["min_ns"]
+            comparison.baseline_spread_ns = (
+                baseline_part["median_ns"] - baseline_part["min_ns"]
+            )
+            comparison.result_changed = (
+                baseline_part["result"] != benchmark.to_dict()["result"]
+            )
+        comparisons.append(comparison)
+
+    return comparisons
@@ -0,0 +1,157 @@
+"""Run a day on many input files in parallel, streaming the results as JSONL."""
+
+import argparse
+import glob
+import json
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Iterator, TextIO
+
+from aoc.cache import file_digest
+from aoc.suite import get_runner
+
+
+def group_files(file_names: list[str]) -> list[list[str]]:
+    """Group file names by their contents, keeping the order they were given in."""
+    groups: dict[str, list[str]] = {}
+    for file_name in file_names:
+        groups.setdefault(file_digest(file_name), []).append(file_name)
+
+    return list(groups.values())
+
+
+def solve_files(
+    day: int,
+    file_names: list[str],
+    parts: list[int],
+    options: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """
+    Solve day parts for files with the same contents, loading them only once.
+
+    Returns a record of the result and timings of each part of each file.
+    """
+    records = []
+    try:
+        runner = get_runner(day)
+        runner.quiet = True
+
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        return [
+            {"day": day, "part": part, "file_name": file_name, "error": error}
+            for part in parts
+            for file_name in file_names
+        ]
+
+    for part in parts:
+        for file_name in file_names:
+            if file_names[0] in runner.loaded:
+                # share the data loaded for the first file as the contents match
+                runner.loaded[file_name] = runner.loaded[file_names[0]]
+            record = {"day": day, "part": part}
+            try:
+                benchmark = runner.solve(file_name, part == 1, **options)
+                record.update(benchmark.to_dict())
+
+            except Exception as exc:
+                record.update(
+                    {"file_name": file_name, "error": f"{type(exc).__name__}: {exc}"},
+                )
+
+            records.append(record)
+
+    return records
+
+
+def run_batch(
+    day: int,
+    file_names: list[str],
+    parts: list[int],
+    jobs: int = 1,
+    **options: Any,
+) -> Iterator[dict[str, Any]]:
+    """
+    Solve day parts for many files on a process pool, yielding records as they finish.
+
+    Files with the same contents are solved by the same worker so they are only
+    loaded once, and at most twice jobs groups are queued at a time so the pending
+    work doesn't grow with the number of files.
+    """
+    groups = iter(group_files(file_names))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending: set[Future] = set()
+        while True:
+            for group in groups:
+                pending.add(executor.submit(solve_files, day, group, parts, options))
+                if len(pending) >= jobs * 2:
+                    break
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def write_records(records: Iterator[dict[str, Any]], file_object: TextIO) -> bool:
+    """Write records one per line as they arrive, returning whether any failed."""
+    failed = False
+    for record in records:
+        failed = failed or "error" in record
+        file_object.write(json.dumps(record))
+        file_object.write("\n")
+        file_object.flush()
+
+    return failed
+
+
+def main() -> int:
+    """Parse the arguments and solve the day for each matching file."""
+    parser = argparse.ArgumentParser(prog="python -m aoc.batch", description=__doc__)
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "pattern",
+        help="glob of input files, e.g. 'inputs/*/day01.txt'",
+    )
+    parser.add_argument("-p", "--part", type=int, choices=(1, 2), action="append")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes")
+    parser.add_argument("-r", "--repeat", type=int, default=1)
+    parser.add_argument("-w", "--warmup", type=int, default=0)
+    parser.add_argument("-o", "--output", metavar="FILE", help="write JSONL to a file")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.warmup < 0:
+        parser.error("--warmup can't be negative")
+
+    sys.path.insert(0, ".")
+    file_names = sorted(glob.glob(args.pattern, recursive=True))
+    if not file_names:
+        print(f"!!!! no files match {args.pattern}", file=sys.stderr)
+        return 1
+
+    records = run_batch(
+        args.day,
+        file_names,
+        args.part or [1, 2],
+        args.jobs,
+        repeat=args.repeat,
+        warmup=args.warmup,
+    )
+    if args.output:
+        with open(args.output, "w") as file_object:
+            failed = write_records(records, file_object)
+    else:
+        failed = write_records(records, sys.stdout)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,178 @@
+"""Benchmark results and statistics."""
+
+import math
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from aoc.lazy import lazy_import
+
+json = lazy_import("json")
+statistics = lazy_import("statistics")
+tracemalloc = lazy_import("tracemalloc")
+
+
+def percentile(values: list[int], percent: float) -> int:
+    """Return the nearest-rank percentile of a list of values."""
+    values_sorted = sorted(values)
+    rank = math.ceil(percent / 100 * len(values_sorted))
+    return values_sorted[max(rank, 1) - 1]
+
+
+class StageResult:
+    """Time and memory used by a single stage of a run."""
+
+    # a plain class as importing dataclasses noticeably slows start up
+
+    def __init__(
+        self,
+        name: str,
+        time_ns: int = 0,
+        peak_bytes: int | None = None,
+        net_bytes: int | None = None,
+    ) -> None:
+        """Ctor."""
+        self.name = name
+        self.time_ns = time_ns
+        self.peak_bytes = peak_bytes
+        self.net_bytes = net_bytes
+
+    def summary(self) -> str:
+        """Return a one line summary of the stage."""
+        summary = f"{self.name:<12} time={self.time_ns / 1e6:.2f}ms"
+        if self.peak_bytes is not None:
+            summary += (
+                f" peak={self.peak_bytes / 1024:.1f}KiB"
+                f" net={self.net_bytes / 1024:.1f}KiB"
+            )
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the stage as a JSON serialisable dict."""
+        return {
+            "name": self.name,
+            "time_ns": self.time_ns,
+            "peak_bytes": self.peak_bytes,
+            "net_bytes": self.net_bytes,
+        }
+
+
+@contextmanager
+def measure_stage(
+    stages: list[StageResult],
+    name: str,
+    trace_memory: bool = False,
+) -> Iterator[StageResult]:
+    """Time a stage, optionally tracing memory, and append it to the stages."""
+    stage = StageResult(name)
+    started_tracing = False
+    if trace_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        tracemalloc.reset_peak()
+        memory_start, _ = tracemalloc.get_traced_memory()
+
+    start_time = time.perf_counter_ns()
+    try:
+        yield stage
+
+    finally:
+        stage.time_ns = time.perf_counter_ns() - start_time
+        if trace_memory:
+            memory_end, memory_peak = tracemalloc.get_traced_memory()
+            stage.peak_bytes = memory_peak - memory_start
+            stage.net_bytes = memory_end - memory_start
+            if started_tracing:
+                tracemalloc.stop()
+
+        stages.append(stage)
+
+
+class BenchmarkResult:
+    """Timings for repeated runs of a part."""
+
+    def __init__(
+        self,
+        name: str,
+        file_name: str,
+        result: Any,
+        warmup: int = 0,
+    ) -> None:
+        """Ctor."""
+        self.name = name
+        self.file_name = file_name
+        self.result = result
+        self.warmup = warmup
+        self.times_ns: list[int] = []
+        self.stages: list[StageResult] = []
+        self.profile: str | None = None
+
+    @property
+    def runs(self) -> int:
+        """Return the number of timed runs."""
+        return len(self.times_ns)
+
+    @property
+    def min_ns(self) -> int:
+        """Return the fastest run time."""
+        return min(self.times_ns)
+
+    @property
+    def median_ns(self) -> float:
+        """Return the median run time."""
+        return statistics.median(self.times_ns)
+
+    @property
+    def p95_ns(self) -> int:
+        """Return the 95th percentile run time."""
+        return percentile(self.times_ns, 95)
+
+    @property
+    def stddev_ns(self) -> float:
+        """Return the sample standard deviation of the run times."""
+        return statistics.stdev(self.times_ns) if self.runs > 1 else 0.0
+
+    def summary(self) -> str:
+        """Return a one line summary of the timings in milliseconds."""
+        if self.runs == 1:
+            return f"time={self.min_ns / 1e6:.2f}ms"
+
+        return (
+            f"min={self.min_ns / 1e6:.2f}ms"
+            f" median={self.median_ns / 1e6:.2f}ms"
+            f" p95={self.p95_ns / 1e6:.2f}ms"
+            f" stddev={self.stddev_ns / 1e6:.2f}ms"
+            f" runs={self.runs}"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the timings and statistics as a JSON serialisable dict."""
+        return {
+            "name": self.name,
+            "file_name": self.file_name,
+            "result": (
+                self.result
+                if isinstance(self.result, (int, float, str))
+                else repr(self.result)
+            ),
+            "warmup": self.warmup,
+            "times_ns": self.times_ns,
+            "stages": [stage.to_dict() for stage in self.stages],
+            "profile": self.profile,
+            "runs": self.runs,
+            "min_ns": self.min_ns,
+            "median_ns": self.median_ns,
+            "p95_ns": self.p95_ns,
+            "stddev_ns": self.stddev_ns,
+        }
+
+    def to_json(self) -> str:
+        """Return the timings and statistics as JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def write_json(self, file_name: str) -> None:
+        """Write the timings and statistics to a JSON file."""
+        with open(file_name, "w") as file_object:
+            file_object.write(self.to_json())
+            file_object.write("\n")
@@ -0,0 +1,167 @@
+"""Content addressed cache of loaded and parsed input data."""
+
+import marshal
+import os
+from functools import cache, partial
+from typing import Any, Callable
+
+from aoc.lazy import lazy_import
+from aoc.shared import is_array
+
+hashlib = lazy_import("hashlib")
+inspect = lazy_import("inspect")
+pickle = lazy_import("pickle")
+tempfile = lazy_import("tempfile")
+
+CACHE_DIR = ".cache/aoc"
+CHUNK_SIZE = 1 << 20
+
+
+def file_digest(file_name: str) -> str:
+    """Return a hash of the contents of a file."""
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as file_object:
+        while chunk := file_object.read(CHUNK_SIZE):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def uncached(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Declare that a loader's data can't be cached, e.g. it refers to temp files."""
+    function.cacheable = False
+    return function
+
+
+def is_cacheable(function: Callable[..., Any] | None) -> bool:
+    """Check if the data loaded by a function, or a partial of one, can be cached."""
+    while isinstance(function, partial):
+        function = function.func
+
+    return getattr(function, "cacheable", True)
+
+
+def function_digest(function: Callable[..., Any]) -> str:
+    """Return a hash of a function's identity and the source it is defined in."""
+    digest = hashlib.sha256()
+    if isinstance(function, partial):
+        # the repr of a partial includes the function's address, which changes
+        # every run
+        digest.update(function_digest(function.func).encode())
+        digest.update(
+            repr((function.args, sorted(function.keywords.items()))).encode(),
+        )
+        return digest.hexdigest()
+
+    digest.update(getattr(function, "__module__", "").encode())
+    digest.update(
+        getattr(function, "__qualname__", type(function).__qualname__).encode(),
+    )
+    try:
+        # any change to the defining module, including helpers, invalidates
+        with open(inspect.getsourcefile(function), "rb") as file_object:
+            digest.update(file_object.read())
+
+    except (OSError, TypeError):
+        code = getattr(function, "__code__", None)
+        if code is not None:
+            digest.update(marshal.dumps(code))
+
+    return digest.hexdigest()
+
+
+@cache
+def package_digest() -> str:
+    """Return a hash of the aoc package sources, which the day loaders build on."""
+    digest = hashlib.sha256()
+    package_path = os.path.dirname(__file__)
+    for name in sorted(os.listdir(package_path)):
+        if name.endswith(".py"):
+            digest.update(name.encode())
+            with open(os.path.join(package_path, name), "rb") as file_object:
+                digest.update(file_object.read())
+
+    return digest.hexdigest()
+
+
+def cache_key(file_name: str, functions: list[Callable[..., Any] | None]) -> str:
+    """Return the cache key for a file loaded by a sequence of functions."""
+    digest = hashlib.sha256(file_digest(file_name).encode())
+    # the functions may call helpers in the package, e.g. aoc.parse
+    digest.update(package_digest().encode())
+    for function in functions:
+        digest.update(function_digest(function).encode() if function else b"-")
+
+    return digest.hexdigest()
+
+
+def _is_array(data: Any) -> bool:
+    return is_array(data) and not data.dtype.hasobject
+
+
+class InputCache:
+    """On disk cache of loaded data, arrays are stored as .npy or .npz."""
+
+    def __init__(self, path: str = CACHE_DIR) -> None:
+        """
+        Create a cache in a directory.
+
+        path - directory to store the cached data in
+        """
+        self.path = path
+
+    def _file_name(self, key: str, extension: str) -> str:
+        return os.path.join(self.path, f"{key}.{extension}")
+
+    def load(self, key: str) -> tuple[bool, Any]:
+        """Return whether the key is cached and the cached data."""
+        for extension in ("npy", "npz", "pickle"):
+            file_name = self._file_name(key, extension)
+            if not os.path.exists(file_name):
+                continue
+
+            try:
+                if extension == "pickle":
+                    with open(file_name, "rb") as file_object:
+                        return True, pickle.load(file_object)
+
+                import numpy as np
+
+                if extension == "npy":
+                    return True, np.load(file_name)
+
+                with np.load(file_name) as arrays:
+                    return True, tuple(
+                        arrays[f"arr_{idx}"] for idx in range(len(arrays))
+                    )
+
+            except Exception:
+                # treat unreadable entries, e.g. pickled classes that moved, as misses
+                return False, None
+
+        return False, None
+
+    def store(self, key: str, data: Any) -> None:
+        """Store the data for the key."""
+        os.makedirs(self.path, exist_ok=True)
+        if _is_array(data):
+            extension = "npy"
+        elif isinstance(data, tuple) and data and all(map(_is_array, data)):
+            extension = "npz"
+        else:
+            extension = "pickle"
+
+        # write to a temporary file then rename so readers never see partial data
+        file_descriptor, temp_file_name = tempfile.mkstemp(dir=self.path)
+        with os.fdopen(file_descriptor, "wb") as file_object:
+            if extension == "pickle":
+                pickle.dump(data, file_object, pickle.HIGHEST_PROTOCOL)
+            else:
+                import numpy as np
+
+                if extension == "npy":
+                    np.save(file_object, data)
+                else:
+                    np.savez(file_object, *data)
+
+        os.replace(temp_file_name, self._file_name(key, extension))
@@ -0,0 +1,285 @@
+"""Generate large synthetic inputs for each day."""
+
+import argparse
+import os
+from typing import Callable, Iterator, TextIO
+
+import numpy as np
+
+GENERATED_DIR = ".cache/aoc/generated"
+CHUNK_ROWS = 100_000
+
+
+def _write_rows(
+    file_object: TextIO,
+    rows: int,
+    chunk_func: Callable[[int], Iterator[str]],
+) -> None:
+    # build and write the rows in chunks to bound memory
+    for chunk_start in range(0, rows, CHUNK_ROWS):
+        chunk_rows = min(CHUNK_ROWS, rows - chunk_start)
+        file_object.write("\n".join(chunk_func(chunk_rows)))
+        file_object.write("\n")
+
+
+def _write_grid(file_object: TextIO, grid: np.ndarray) -> None:
+    for chunk_start in range(0, grid.shape[0], CHUNK_ROWS // 100):
+        chunk = grid[chunk_start : chunk_start + CHUNK_ROWS // 100]
+        lines = np.hstack([chunk, np.full((chunk.shape[0], 1), ord("\n"), np.uint8)])
+        file_object.write(lines.tobytes().decode())
+
+
+def generate_day01(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write size rows of location id pairs, with ids repeated across the lists."""
+    location_ids = rng.integers(10_000, 100_000, size=max(size // 2, 1))
+
+    def chunk_func(rows: int) -> Iterator[str]:
+        pairs = rng.choice(location_ids, size=(rows, 2))
+        return (f"{lhs}   {rhs}" for lhs, rhs in pairs.tolist())
+
+    _write_rows(file_object, size, chunk_func)
+
+
+def generate_day02(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write size reports of mostly gradual levels with occasional bad levels."""
+
+    def chunk_func(rows: int) -> Iterator[str]:
+        for _ in range(rows):
+            length = int(rng.integers(5, 9))
+            steps = rng.integers(1, 4, size=length) * (1 if rng.random() < 0.5 else -1)
+            if rng.random() < 0.5:
+                steps[rng.integers(length)] = rng.integers(-4, 5)
+            levels = int(rng.integers(20, 80)) + np.cumsum(steps)
+            yield " ".join(map(str, levels.tolist()))
+
+    _write_rows(file_object, size, chunk_func)
+
+
+def generate_day03(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write roughly size bytes of corrupted memory with instructions."""
+    tokens = [
+        "mul({},{})",
+        "mul({},{})",
+        "mul({},{})",
+        "do()",
+        "don't()",
+        "mul[{},{}]",
+        "mul({} ,{})",
+        "*&^%$#@!",
+        "from()",
+        "select()",
+        "'what()?",
+    ]
+    written = 0
+    while written < size:
+        text = "".join(
+            tokens[idx].format(*rng.integers(1, 1000, size=2).tolist())
+            for idx in rng.integers(len(tokens), size=1000).tolist()
+        )
+        file_object.write(text)
+        written += len(text)
+    file_object.write("\n")
+
+
+def generate_day04(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write a size by size grid of the letters XMAS."""
+    letters = np.frombuffer(b"XMAS", dtype=np.uint8)
+    _write_grid(file_object, rng.choice(letters, size=(size, size)))
+
+
+def generate_day05(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write complete ordering rules for 49 pages and size updates, half ordered."""
+    pages = rng.permutation(np.arange(10, 100))[:49].tolist()
+    for idx, page_l in enumerate(pages):
+        for page_r in pages[idx + 1 :]:
+            file_object.write(f"{page_l}|{page_r}\n")
+    file_object.write("\n")
+
+    def chunk_func(rows: int) -> Iterator[str]:
+        for _ in range(rows):
+            length = int(rng.integers(2, 12)) * 2 + 1
+            update = rng.choice(pages, size=length, replace=False).tolist()
+            if rng.random() < 0.5:
+                update.sort(key=pages.index)
+            yield ",".join(map(str, update))
+
+    _write_rows(file_object, size, chunk_func)
+
+
+def _guard_escapes(grid: np.ndarray, y_pos: int, x_pos: int) -> bool:
+    y_max, x_max = grid.shape
+    obstructions = grid == ord("#")
+    x_dir, y_dir = 0, -1
+    visited = set()
+    while True:
+        if (x_pos, y_pos, x_dir, y_dir) in visited:
+            return False
+        visited.add((x_pos, y_pos, x_dir, y_dir))
+
+        x_next, y_next = x_pos + x_dir, y_pos + y_dir
+        if not (0 <= x_next < x_max and 0 <= y_next < y_max):
+            return True
+
+        if obstructions[y_next, x_next]:
+            x_dir, y_dir = -y_dir, x_dir
+        else:
+            x_pos, y_pos = x_next, y_next
+
+
+def generate_day06(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write a size by size map with a guard that leaves it."""
+    grid = np.where(rng.random((size, size)) < 0.05, ord("#"), ord(".")).astype(
+        np.uint8,
+    )
+    y_pos, x_pos = size // 2, size // 2
+    grid[y_pos, x_pos] = ord("^")
+    if not _guard_escapes(grid, y_pos, x_pos):
+        # clear the way north so the guard always leaves the map
+        grid[:y_pos, x_pos] = ord(".")
+    _write_grid(file_object, grid)
+
+
+def generate_day07(
+    file_object: TextIO,
+    size: int,
+    rng: np.random.Generator,
+    depth: int = 12,
+) -> None:
+    """Write size equations of depth operands, about half of them solvable."""
+
+    def chunk_func(rows: int) -> Iterator[str]:
+        for _ in range(rows):
+            values = rng.integers(1, 100, size=int(rng.integers(2, depth + 1)))
+            values = values.tolist()
+            target = values[0]
+            for value in values[1:]:
+                operator = rng.integers(3)
+                if operator == 0:
+                    target += value
+                elif operator == 1:
+                    target *= value
+                else:
+                    target = int(f"{target}{value}")
+            if rng.random() < 0.5:
+                target += 1
+            yield f"{target}: {' '.join(map(str, values))}"
+
+    _write_rows(file_object, size, chunk_func)
+
+
+def generate_day08(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write a size by size map with sparse antennas."""
+    antennas = np.frombuffer(
+        b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+        dtype=np.uint8,
+    )
+    grid = np.where(
+        rng.random((size, size)) < 0.01,
+        rng.choice(antennas, size=(size, size)),
+        ord("."),
+    ).astype(np.uint8)
+    _write_grid(file_object, grid)
+
+
+def generate_day09(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write a disk map of size files."""
+    codes = rng.integers(0, 10, size=size * 2 - 1)
+    codes[::2] = rng.integers(1, 10, size=size)
+    file_object.write((codes + ord("0")).astype(np.uint8).tobytes().decode())
+    file_object.write("\n")
+
+
+def generate_day10(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write a size by size topographic map of gradual slopes."""
+    y_pos, x_pos = np.mgrid[0:size, 0:size]
+    phase = rng.integers(0, 10, size=2)
+    heights = (y_pos + phase[0]) % 20 + (x_pos + phase[1]) % 20
+    heights = np.abs(heights % 20 - 10).clip(0, 9)
+    noise = rng.random((size, size)) < 0.05
+    heights[noise] = rng.integers(0, 10, size=int(noise.sum()))
+    _write_grid(file_object, (heights + ord("0")).astype(np.uint8))
+
+
+def generate_day11(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write size stones."""
+    stones = rng.integers(0, 10_000_000, size=size)
+    file_object.write(" ".join(map(str, stones.tolist())))
+    file_object.write("\n")
+
+
+def generate_day12(file_object: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Write a size by size garden of irregular plant regions."""
+    plants = np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", dtype=np.uint8)
+    block_size = 8
+    blocks = size // block_size + 1
+    regions = rng.choice(plants, size=(blocks, blocks))
+    grid = np.repeat(np.repeat(regions, block_size, 0), block_size, 1)[:size, :size]
+    noise = rng.random((size, size)) < 0.1
+    grid[noise] = rng.choice(plants, size=int(noise.sum()))
+    _write_grid(file_object, grid)
+
+
+GENERATORS: dict[int, Callable[[TextIO, int, np.random.Generator], None]] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+    9: generate_day09,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+}
+
+
+def generated_file_name(day: int, size: int, seed: int = 0) -> str:
+    """Return the file name of a generated input."""
+    return os.path.join(GENERATED_DIR, f"day{day:02d}.size{size}.seed{seed}.txt")
+
+
+def generate(day: int, size: int, seed: int = 0, file_name: str | None = None) -> str:
+    """
+    Write a generated input for a day if it doesn't exist and return its file name.
+
+    day - day number
+    size - rows, grid width and height, files, stones or bytes depending on the day
+    seed - random seed, the same size and seed always generates the same input
+    file_name - (optional) file to write instead of the generated input cache
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"no generator for day {day}")
+
+    file_name = file_name or generated_file_name(day, size, seed)
+    if os.path.exists(file_name):
+        return file_name
+
+    os.makedirs(os.path.dirname(file_name) or ".", exist_ok=True)
+    temp_file_name = f"{file_name}.{os.getpid()}.tmp"
+    with open(temp_file_name, "w") as file_object:
+        GENERATORS[day](file_object, size, np.random.default_rng([day, size, seed]))
+
+    os.replace(temp_file_name, file_name)
+    return file_name
+
+
+def main() -> None:
+    """Write a generated input for a day."""
+    parser = argparse.ArgumentParser(prog="python -m aoc.generate", description=__doc__)
+    parser.add_argument("day", type=int)
+    parser.add_argument("size", type=int)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", metavar="FILE")
+    args = parser.parse_args()
+
+    print(generate(args.day, args.size, args.seed, args.output))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+
+    except KeyboardInterrupt:
+        pass
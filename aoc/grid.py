@@ -0,0 +1,142 @@
+"""Character grid loading and searching."""
+
+import os
+
+import numpy as np
+
+DIGIT_ZERO = ord("0")
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+DIRECTIONS = (
+    (1, 0),
+    (1, 1),
+    (0, 1),
+    (-1, 1),
+    (-1, 0),
+    (-1, -1),
+    (0, -1),
+    (1, -1),
+)
+BAND_CELLS = 1 << 24
+
+
+def load_grid(file_name: str, digits: bool = False) -> np.ndarray:
+    """
+    Load a character grid as a uint8 array of character codes.
+
+    The file is read once into a writable buffer which the array is a strided view
+    of, so the line ends are skipped without copying.
+
+    file_name - file containing lines of equal length
+    digits - decode the characters 0 to 9 to their values
+    """
+    buffer = bytearray(os.path.getsize(file_name))
+    with open(file_name, "rb") as file_object:
+        file_object.readinto(buffer)
+
+    line_end = buffer.find(b"\n")
+    line_size = len(buffer) + 1 if line_end < 0 else line_end + 1
+    width = line_size - 1
+    if width and buffer[width - 1] == CARRIAGE_RETURN:
+        width -= 1
+
+    # the last line may not have a line end, and every other line must end where
+    # the first one does with no line ends in between
+    height = (len(buffer) + line_size - width) // line_size
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    line_ends = data[line_size - 1 :: line_size]
+    carriage_returns = data[width::line_size][: len(line_ends)]
+    if (
+        len(buffer) not in (height * line_size, (height - 1) * line_size + width)
+        or buffer.count(b"\n") != len(line_ends)
+        or np.any(line_ends != NEWLINE)
+        or (width < line_size - 1 and np.any(carriage_returns != CARRIAGE_RETURN))
+    ):
+        raise ValueError(f"{file_name} lines are not all the same length")
+
+    grid = np.lib.stride_tricks.as_strided(
+        data,
+        shape=(height, width),
+        strides=(line_size, 1),
+    )
+    return grid - DIGIT_ZERO if digits else grid
+
+
+def find_chars(grid: np.ndarray, chars: str | bytes | int) -> list[tuple[int, int]]:
+    """Return the x, y coords of the cells matching any of the chars in row order."""
+    if isinstance(chars, int):
+        codes = [chars]
+    else:
+        codes = list(chars.encode() if isinstance(chars, str) else chars)
+
+    y_pos, x_pos = np.nonzero(np.isin(grid, codes))
+    return list(zip(x_pos.tolist(), y_pos.tolist(), strict=True))
+
+
+def _count_word_rows(
+    grid: np.ndarray,
+    word: bytes,
+    directions: tuple[tuple[int, int], ...],
+    row_start: int,
+    row_end: int,
+) -> int:
+    height, width = grid.shape
+    span = len(word) - 1
+    letters = {code: grid == code for code in set(word)}
+    total = 0
+    for x_dir, y_dir in directions:
+        # the rows and columns the word can start in without leaving the grid
+        y_start = max(row_start, -span * y_dir)
+        y_end = min(row_end, height - span * y_dir)
+        x_start = max(0, -span * x_dir)
+        x_end = min(width, width - span * x_dir)
+        if y_start >= y_end or x_start >= x_end:
+            continue
+
+        # and the cells holding each letter shifted back to the word's start
+        found = np.ones((y_end - y_start, x_end - x_start), bool)
+        for idx, code in enumerate(word):
+            found &= letters[code][
+                y_start + idx * y_dir : y_end + idx * y_dir,
+                x_start + idx * x_dir : x_end + idx * x_dir,
+            ]
+        total += int(np.count_nonzero(found))
+
+    return total
+
+
+def count_word(
+    grid: np.ndarray,
+    word: str | bytes,
+    directions: tuple[tuple[int, int], ...] = DIRECTIONS,
+    band_cells: int = BAND_CELLS,
+) -> int:
+    """
+    Count a word in a grid in each direction, with shifted slices of the grid.
+
+    grid - uint8 array of character codes
+    word - word to find
+    directions - x, y steps between the letters, defaults to all 8 directions
+    band_cells - approximate cells searched at once, which bounds the memory used
+    """
+    word = word.encode() if isinstance(word, str) else bytes(word)
+    if not word:
+        return 0
+
+    height, width = grid.shape
+    span = len(word) - 1
+    band_rows = max(band_cells // max(width, 1), 1)
+    total = 0
+    for row_start in range(0, height, band_rows):
+        # search the words starting in the band, which may reach the rows either side
+        row_end = min(row_start + band_rows, height)
+        offset = max(row_start - span, 0)
+        total += _count_word_rows(
+            grid[offset : min(row_end + span, height)],
+            word,
+            directions,
+            row_start - offset,
+            row_end - offset,
+        )
+
+    return total
@@ -0,0 +1,55 @@
+"""Lazy imports to keep start up fast."""
+
+import _thread
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any
+
+# importlib's LazyLoader isn't thread safe before 3.13, so modules are loaded
+# under a lock instead, e.g. when the input is loaded on a background thread
+_LOCK = _thread.RLock()
+
+
+class _LazyModule(ModuleType):
+    """Stand in for a module that imports it when an attribute is first used."""
+
+    def __getattr__(self, attr: str) -> Any:  # noqa: ANN401
+        with _LOCK:
+            name = self.__name__
+            if sys.modules.get(name) is self:
+                del sys.modules[name]
+                try:
+                    module = importlib.import_module(name)
+                except BaseException:
+                    sys.modules[name] = self
+                    raise
+
+            else:
+                module = sys.modules.get(name) or importlib.import_module(name)
+
+            # later lookups find the module's attributes without coming back here
+            for key, value in vars(module).items():
+                if key not in ("__name__", "__class__", "__dict__"):
+                    setattr(self, key, value)
+
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Return a module that is only imported when one of its attributes is first used.
+
+    name - absolute module name, the parent package of a submodule is imported now
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    module = _LazyModule(name)
+    sys.modules[name] = module
+    return module
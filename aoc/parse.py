@@ -0,0 +1,127 @@
+"""Vectorised parsing of numbers from text files."""
+
+import os
+from typing import Iterator
+
+import numpy as np
+
+CHUNK_BYTES = 1 << 26
+NEWLINE = ord("\n")
+DIGIT_ZERO = ord("0")
+DIGIT_NINE = ord("9")
+MINUS = ord("-")
+# an int64 holds any 18 digit number
+POWERS_OF_TEN = 10 ** np.arange(19, dtype=np.int64)
+
+
+def parse_ints(text: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the ints in text without a python loop.
+
+    text - uint8 array of the text
+    Returns the ints and the line number of each as int64 arrays.
+    """
+    digits = (text >= DIGIT_ZERO) & (text <= DIGIT_NINE)
+    # numbers start where a digit follows a non-digit, and end after the last digit
+    edges = np.flatnonzero(np.diff(digits, prepend=False, append=False))
+    starts, ends = edges[::2], edges[1::2]
+    if not len(starts):
+        return np.zeros(0, np.int64), np.zeros(0, np.int64)
+
+    digit_idx = np.flatnonzero(digits)
+    lengths = ends - starts
+    # the place of each digit counts back from the end of its number
+    places = np.repeat(ends - 1, lengths) - digit_idx
+    digit_values = (text[digit_idx] - DIGIT_ZERO).astype(np.int64)
+    offsets = np.cumsum(lengths) - lengths
+    values = np.add.reduceat(digit_values * POWERS_OF_TEN[places], offsets)
+    # a minus sign directly before a number makes it negative
+    negative = text[np.maximum(starts - 1, 0)] == MINUS
+    negative[starts == 0] = False
+    values[negative] *= -1
+    lines = np.searchsorted(np.flatnonzero(text == NEWLINE), starts)
+    return values, lines
+
+
+def _line_end(text: np.ndarray, pos: int) -> int:
+    # search forwards in blocks for the end of the line
+    while pos < len(text):
+        newlines = np.flatnonzero(text[pos : pos + 4096] == NEWLINE)
+        if len(newlines):
+            return pos + int(newlines[0]) + 1
+
+        pos += 4096
+
+    return len(text)
+
+
+def line_ranges(file_name: str, chunk_bytes: int = CHUNK_BYTES) -> list[range]:
+    """Split a file into byte ranges of about chunk_bytes that end with a line."""
+    if not os.path.getsize(file_name):
+        # empty files can't be mapped
+        return []
+
+    text = np.memmap(file_name, np.uint8, "r")
+    ranges = []
+    start = 0
+    while start < len(text):
+        end = _line_end(text, min(start + chunk_bytes, len(text)) - 1)
+        ranges.append(range(start, end))
+        start = end
+
+    return ranges
+
+
+def parse_range(file_name: str, byte_range: range) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the ints in a byte range of a file.
+
+    Returns the ints and the line number of each within the range as int64 arrays.
+    """
+    text = np.memmap(file_name, np.uint8, "r")
+    return parse_ints(np.asarray(text[byte_range.start : byte_range.stop]))
+
+
+def iter_ints(
+    file_name: str,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Parse the ints in a file a chunk of whole lines at a time.
+
+    file_name - file to load
+    chunk_bytes - approximate size of each chunk, which bounds the memory used
+                  by parsing to a small multiple of it
+    Yields the ints of each chunk and the line number of each as int64 arrays.
+    """
+    ranges = line_ranges(file_name, chunk_bytes)
+    if not ranges:
+        return
+
+    text = np.memmap(file_name, np.uint8, "r")
+    line_start = 0
+    for byte_range in ranges:
+        chunk = np.asarray(text[byte_range.start : byte_range.stop])
+        values, lines = parse_ints(chunk)
+        yield values, lines + line_start
+        line_start += int(np.count_nonzero(chunk == NEWLINE))
+
+
+def load_ints(
+    file_name: str,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Load the ints in a file, parsing a chunk of whole lines at a time.
+
+    file_name - file to load
+    chunk_bytes - approximate size of each chunk, which bounds the memory used
+                  by parsing to a small multiple of it
+    Returns the ints and the line number of each as int64 arrays.
+    """
+    chunks = list(iter_ints(file_name, chunk_bytes))
+    if not chunks:
+        return parse_ints(np.zeros(0, np.uint8))
+
+    values_chunks, lines_chunks = zip(*chunks, strict=True)
+    return np.concatenate(values_chunks), np.concatenate(lines_chunks)
@@ -0,0 +1,41 @@
+"""Profile solvers with cProfile."""
+
+import io
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+from aoc.lazy import lazy_import
+
+cProfile = lazy_import("cProfile")  # noqa: N816
+pstats = lazy_import("pstats")
+
+PROFILE_DIR = "profiles"
+
+
+def profile_file_name(name: str, test: bool = False) -> str:
+    """Return the stats file name for a day part."""
+    test_str = ".test" if test else ""
+    return os.path.join(PROFILE_DIR, f"day{name}{test_str}.pstats")
+
+
+@contextmanager
+def profile_to(file_name: str) -> Iterator[None]:
+    """Profile the block and dump the stats to a file."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+
+    finally:
+        profiler.disable()
+        os.makedirs(os.path.dirname(file_name) or ".", exist_ok=True)
+        profiler.dump_stats(file_name)
+
+
+def format_profile(file_name: str, top: int) -> str:
+    """Return the top functions by cumulative time from a stats file."""
+    stream = io.StringIO()
+    stats = pstats.Stats(file_name, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return stream.getvalue()
@@ -0,0 +1,196 @@
+"""Low overhead progress reporting for hot loops."""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Self
+
+from aoc.lazy import lazy_import
+
+multiprocessing = lazy_import("multiprocessing")
+threading = lazy_import("threading")
+tqdm = lazy_import("tqdm")
+
+REFRESH_INTERVAL = 0.1
+
+# progress is shown unless disabled, and sent to the queue of an aggregating
+# process instead of being output if there is one
+_enabled = True
+_queue: Any = None
+
+
+def configure(enabled: bool = True, queue: Any = None) -> None:
+    """Enable or disable progress and set the queue to send it to, if any."""
+    global _enabled, _queue
+    _enabled = enabled
+    _queue = queue
+
+
+def is_enabled() -> bool:
+    """Check if progress is enabled."""
+    return _enabled
+
+
+def has_queue() -> bool:
+    """Check if progress is sent to an aggregating process."""
+    return _queue is not None
+
+
+@contextmanager
+def enabled(enable: bool) -> Iterator[None]:
+    """Enable or disable progress for the block."""
+    global _enabled
+    enabled_previous = _enabled
+    _enabled = enable
+    try:
+        yield
+
+    finally:
+        _enabled = enabled_previous
+
+
+class NullProgress:
+    """Progress that does nothing."""
+
+    def __init__(self, iterable: Iterable | None = None) -> None:
+        """Ctor."""
+        self.iterable = iterable
+
+    def __enter__(self) -> Self:
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit the context."""
+
+    def __iter__(self) -> Iterator:
+        """Iterate the iterable."""
+        return iter(self.iterable)
+
+    def update(self, count: int = 1) -> None:
+        """Do nothing."""
+
+    def close(self) -> None:
+        """Do nothing."""
+
+
+class Progress(NullProgress):
+    """Progress that counts every update but only reports a few times a second."""
+
+    def __init__(
+        self,
+        iterable: Iterable | None = None,
+        total: int | None = None,
+        desc: str | None = None,
+    ) -> None:
+        """
+        Count progress through an iterable or of updates.
+
+        iterable - (optional) iterable to count the items of
+        total - (optional) expected count, defaults to the length of the iterable
+        desc - (optional) description to output with the progress
+        """
+        super().__init__(iterable)
+        if total is None and hasattr(iterable, "__len__"):
+            total = len(iterable)
+        self.total = total
+        self.count = 0
+        self.count_reported = 0
+        # only check the time every step updates, adjusting the step to the rate
+        self.count_check = 1
+        self.step = 1
+        self.time_report = time.monotonic() + REFRESH_INTERVAL
+        self.bar = None
+        if _queue is not None:
+            _queue.put((total or 0, 0))
+        else:
+            self.bar = tqdm.tqdm(total=total, desc=desc)
+
+    def __exit__(self, *args: object) -> None:
+        """Exit the context, reporting the final progress."""
+        self.close()
+
+    def __iter__(self) -> Iterator:
+        """Iterate the iterable, counting the items and reporting them at the end."""
+        # progress used without a with block still reports its final count
+        try:
+            for item in self.iterable:
+                yield item
+                self.count += 1
+                if self.count >= self.count_check:
+                    self._check()
+
+        finally:
+            self.close()
+
+    def update(self, count: int = 1) -> None:
+        """Add to the progress count."""
+        self.count += count
+        if self.count >= self.count_check:
+            self._check()
+
+    def _check(self) -> None:
+        now = time.monotonic()
+        if now < self.time_report:
+            self.step *= 2
+        else:
+            self._report()
+            self.time_report = now + REFRESH_INTERVAL
+            self.step = max(self.step // 2, 1)
+        self.count_check = self.count + self.step
+
+    def _report(self) -> None:
+        count = self.count - self.count_reported
+        self.count_reported = self.count
+        if self.bar is not None:
+            self.bar.update(count)
+        elif count:
+            _queue.put((0, count))
+
+    def close(self) -> None:
+        """Report the final progress."""
+        self._report()
+        if self.bar is not None:
+            self.bar.close()
+            self.bar = None
+
+
+def progress(
+    iterable: Iterable | None = None,
+    total: int | None = None,
+    desc: str | None = None,
+) -> NullProgress:
+    """Return a progress counter, which does nothing if progress is disabled."""
+    if not _enabled:
+        return NullProgress(iterable)
+
+    return Progress(iterable, total, desc)
+
+
+@contextmanager
+def aggregate(desc: str | None = None) -> Iterator[Any]:
+    """
+    Output the combined progress sent by other processes.
+
+    Yields a queue to pass to the processes, which then call configure(queue=queue).
+    """
+    with multiprocessing.Manager() as manager:
+        queue = manager.Queue()
+        bar = tqdm.tqdm(total=0, desc=desc)
+
+        def output() -> None:
+            while (message := queue.get()) is not None:
+                total, count = message
+                if total:
+                    bar.total += total
+                    bar.refresh()
+                bar.update(count)
+
+        thread = threading.Thread(target=output, daemon=True)
+        thread.start()
+        try:
+            yield queue
+
+        finally:
+            queue.put(None)
+            thread.join()
+            bar.close()
@@ -0,0 +1,62 @@
+"""Share loaded data between runs without solvers seeing each other's changes."""
+
+import sys
+from typing import Any, Callable
+
+from aoc.lazy import lazy_import
+
+copy = lazy_import("copy")
+
+IMMUTABLE_TYPES = (int, float, complex, str, bytes, bool, frozenset, type(None))
+
+
+def mutates_data(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Declare that a solver modifies its data, so it is given a copy."""
+    function.mutates_data = True
+    return function
+
+
+def is_array(data: Any) -> bool:
+    """Check if data is a numpy array, without importing numpy."""
+    # an array can only exist if numpy has already been imported
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(data, numpy.ndarray)
+
+
+def copy_data(data: Any) -> Any:
+    """Return a copy of data that can be modified without changing the original."""
+    if isinstance(data, IMMUTABLE_TYPES):
+        return data
+
+    if is_array(data):
+        return data.copy()
+
+    if isinstance(data, list):
+        # lists of immutable values, e.g. ints, only need a slice
+        if not data or isinstance(data[0], IMMUTABLE_TYPES):
+            return data[:]
+        return [copy_data(val) for val in data]
+
+    if isinstance(data, tuple):
+        return tuple(copy_data(val) for val in data)
+
+    if isinstance(data, dict):
+        return {key: copy_data(val) for key, val in data.items()}
+
+    if isinstance(data, set):
+        return set(data)
+
+    return copy.deepcopy(data)
+
+
+def read_only(data: Any) -> Any:
+    """Return data with any arrays replaced by read only views."""
+    if is_array(data):
+        view = data.view()
+        view.flags.writeable = False
+        return view
+
+    if isinstance(data, tuple):
+        return tuple(read_only(val) for val in data)
+
+    return data
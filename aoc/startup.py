@@ -0,0 +1,149 @@
+"""Report day module start up times from python -X importtime."""
+
+import argparse
+import subprocess
+import sys
+import time
+
+from aoc.suite import find_days, parse_days
+
+DEFAULT_BUDGET_MS = 50.0
+DEFAULT_EXCLUDE = ["numpy", "dataclasses"]
+
+
+def import_times(module: str) -> list[tuple[str, int, int, int]]:
+    """
+    Import a module in a fresh interpreter and return the modules it imported.
+
+    Each module is returned as its name, nesting depth and self and cumulative
+    import times in microseconds, in the order the imports finished.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+
+    return times
+
+
+def module_times(
+    times: list[tuple[str, int, int, int]],
+    module: str,
+) -> list[tuple[str, int, int, int]]:
+    """Return the times up to and including the module's own top level entry."""
+    # the interpreter may import more modules after the one asked for
+    for idx, (name, depth, _, _) in enumerate(times):
+        if depth == 0 and name == module:
+            return times[: idx + 1]
+
+    raise ValueError(f"{module} not found in the import times")
+
+
+def excluded_time(times: list[tuple[str, int, int, int]], exclude: list[str]) -> int:
+    """Return the cumulative import time in microseconds of the excluded modules."""
+    return sum(cumulative_us for name, _, _, cumulative_us in times if name in exclude)
+
+
+def direct_imports(times: list[tuple[str, int, int, int]]) -> list[tuple[str, int]]:
+    """Return the slowest modules imported by the last module and their times."""
+    # pass the times from module_times so the last one is the module asked for
+    direct = []
+    for name, depth, _, cumulative_us in reversed(times[:-1]):
+        if depth == 0:
+            break
+
+        if depth == 1:
+            direct.append((name, cumulative_us))
+
+    return sorted(direct, key=lambda val: -val[1])
+
+
+def startup_time(module: str, repeat: int = 5) -> float:
+    """Return the best wall time in seconds to start python and import a module."""
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+        best = min(best, time.perf_counter() - start_time)
+
+    return best
+
+
+def main() -> int:
+    """Report the start up time of each day and fail if any are over budget."""
+    parser = argparse.ArgumentParser(prog="python -m aoc.startup", description=__doc__)
+    parser.add_argument("days", nargs="*", help="day numbers or ranges, e.g. 1-5 7")
+    parser.add_argument(
+        "-b",
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"maximum import time of a day module (default {DEFAULT_BUDGET_MS})",
+    )
+    parser.add_argument(
+        "-x",
+        "--exclude",
+        action="append",
+        help="modules the days need to solve which don't count towards the budget"
+        f" (default {' '.join(DEFAULT_EXCLUDE)})",
+    )
+    parser.add_argument(
+        "-t",
+        "--top",
+        type=int,
+        default=5,
+        help="output this many of the slowest top level imports",
+    )
+    args = parser.parse_args()
+
+    exclude = args.exclude or DEFAULT_EXCLUDE
+    baseline = startup_time("sys")
+    print(f"#### interpreter wall={baseline * 1000:.1f}ms")
+
+    over_budget = []
+    for day in parse_days(args.days, find_days()):
+        module = f"day{day:02d}"
+        # import times are noisy so use the fastest of a few
+        times = min(
+            [module_times(import_times(module), module) for _ in range(3)],
+            key=lambda val: val[-1][3],
+        )
+        import_ms = times[-1][3] / 1000
+        budget_ms = import_ms - excluded_time(times, exclude) / 1000
+        wall = startup_time(module)
+        status = "ok" if budget_ms <= args.budget_ms else "OVER BUDGET"
+        print(
+            f"#### {module} import={import_ms:.1f}ms budgeted={budget_ms:.1f}ms"
+            f" wall={wall * 1000:.1f}ms {status}",
+        )
+
+        for name, cumulative_us in direct_imports(times)[: args.top]:
+            print(f"     {name:<24} {cumulative_us / 1000:.1f}ms")
+
+        if budget_ms > args.budget_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"!!!! over {args.budget_ms}ms budget {' '.join(over_budget)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+
+    except KeyboardInterrupt:
+        pass
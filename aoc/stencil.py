@@ -0,0 +1,122 @@
+"""Match small 2D templates against a character grid with array masks."""
+
+from typing import Iterable
+
+import numpy as np
+
+WILDCARD = "."
+
+
+class Stencil:
+    """Template of characters to match, with wildcard cells that match anything."""
+
+    def __init__(
+        self,
+        rows: Iterable[str],
+        wildcard: str = WILDCARD,
+        anchor: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Compile the template to the offset and character code of each cell to match.
+
+        rows - lines of the template, all the same length
+        wildcard - character of the cells that match anything
+        anchor - (optional) x, y coords of the cell matches are found at, which
+                 lines up the variants of a template, defaults to the centre
+        """
+        self.rows = tuple(rows)
+        self.wildcard = wildcard
+        if len({len(row) for row in self.rows}) > 1:
+            raise ValueError("stencil rows are not all the same length")
+
+        self.height = len(self.rows)
+        self.width = len(self.rows[0]) if self.rows else 0
+        self.anchor = (self.width // 2, self.height // 2) if anchor is None else anchor
+        if not (0 <= self.anchor[0] < self.width and 0 <= self.anchor[1] < self.height):
+            raise ValueError(f"stencil anchor {self.anchor} is outside the template")
+        self.cells = [
+            (x_pos, y_pos, ord(char))
+            for y_pos, row in enumerate(self.rows)
+            for x_pos, char in enumerate(row)
+            if char != wildcard
+        ]
+
+    def variants(self, rotate: bool = False, reflect: bool = False) -> list["Stencil"]:
+        """Return the distinct rotations by 90 degrees and reflections, in order."""
+        chars = np.array([list(row) for row in self.rows]).reshape(
+            self.height,
+            self.width,
+        )
+        # the anchor moves with the cells, so it's found by marking it
+        marked = np.zeros((self.height, self.width), bool)
+        marked[self.anchor[1], self.anchor[0]] = True
+        flips = [(chars, marked)]
+        if reflect:
+            flips.append((chars[:, ::-1], marked[:, ::-1]))
+
+        found: dict[tuple[tuple[str, ...], tuple[int, int]], Stencil] = {}
+        for flip, flip_marked in flips:
+            for turns in range(4 if rotate else 1):
+                rows = tuple("".join(row) for row in np.rot90(flip, turns))
+                y_pos, x_pos = np.argwhere(np.rot90(flip_marked, turns))[0].tolist()
+                if (rows, (x_pos, y_pos)) not in found:
+                    found[rows, (x_pos, y_pos)] = Stencil(
+                        rows,
+                        self.wildcard,
+                        (x_pos, y_pos),
+                    )
+
+        return list(found.values())
+
+    def match(
+        self,
+        grid: np.ndarray,
+        letters: dict[int, np.ndarray] | None = None,
+    ) -> np.ndarray:
+        """
+        Return a mask of the cells the anchor of the template matches at.
+
+        grid - uint8 array of character codes
+        letters - (optional) cache of the mask of the grid cells holding each code
+        """
+        letters = {} if letters is None else letters
+        height, width = grid.shape
+        rows = height - self.height + 1
+        cols = width - self.width + 1
+        found = np.zeros((height, width), bool)
+        if rows <= 0 or cols <= 0:
+            return found
+
+        # each cell's mask shifted back to the anchor of the template
+        x_anchor, y_anchor = self.anchor
+        matched = found[y_anchor : y_anchor + rows, x_anchor : x_anchor + cols]
+        matched[:] = True
+        for x_pos, y_pos, code in self.cells:
+            if code not in letters:
+                letters[code] = grid == code
+            matched &= letters[code][y_pos : y_pos + rows, x_pos : x_pos + cols]
+
+        return found
+
+
+def match_at_least(
+    grid: np.ndarray,
+    stencils: Iterable[Stencil],
+    count: int = 1,
+) -> np.ndarray:
+    """Return a mask of the cells at least count of the stencils match at."""
+    letters: dict[int, np.ndarray] = {}
+    matches = np.zeros(grid.shape, np.int32)
+    for stencil in stencils:
+        matches += stencil.match(grid, letters)
+
+    return matches >= count
+
+
+def count_matches(
+    grid: np.ndarray,
+    stencils: Iterable[Stencil],
+    count: int = 1,
+) -> int:
+    """Count the cells at least count of the stencils match at."""
+    return int(np.count_nonzero(match_at_least(grid, stencils, count)))
@@ -0,0 +1,152 @@
+"""Find and run the day modules."""
+
+import glob
+import importlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from aoc import Runner
+from aoc.benchmark import BenchmarkResult
+from aoc.cache import InputCache
+from aoc.progress import aggregate, configure
+
+DAY_MODULE_GLOB = "day[0-9][0-9].py"
+STAGE_COLUMNS = ("cache", "loader", "line_parser", "load_parser")
+
+
+def find_days(path: str = ".") -> list[int]:
+    """Find the day numbers of the day modules in a directory."""
+    return sorted(
+        int(re.sub(r"\D", "", os.path.basename(file_name)))
+        for file_name in glob.glob(os.path.join(path, DAY_MODULE_GLOB))
+    )
+
+
+def parse_days(days: list[str], available: list[int]) -> list[int]:
+    """Parse day numbers and ranges such as 3 or 1-5, defaulting to all days."""
+    if not days:
+        return available
+
+    selected = set()
+    for day_range in days:
+        first, _, last = day_range.partition("-")
+        selected.update(range(int(first), int(last or first) + 1))
+
+    return [day for day in available if day in selected]
+
+
+def get_runner(day: int) -> Runner:
+    """Import a day module and return its runner."""
+    module = importlib.import_module(f"day{day:02d}")
+    return module.get_runner()
+
+
+@dataclass
+class PartResult:
+    """Outcome of running a day part on the test and proper data."""
+
+    day: int
+    part: int
+    benchmark: BenchmarkResult | None = None
+    error: str | None = None
+
+    @property
+    def name(self) -> str:
+        """Return the day part name."""
+        return f"{self.day:02d}-{self.part}"
+
+
+def run_part(
+    day: int,
+    part: int,
+    options: dict[str, Any],
+    cache: bool = False,
+    profile: int = 0,
+    progress_queue: Any = None,
+) -> PartResult:
+    """Run a day part, capturing any failure."""
+    part_result = PartResult(day, part)
+    try:
+        if progress_queue is not None:
+            configure(queue=progress_queue)
+        runner = get_runner(day)
+        runner.quiet = True
+        if cache:
+            runner.cache = InputCache()
+        runner.profile = profile
+        run_part_func = runner.part_1 if part == 1 else runner.part_2
+        part_result.benchmark = run_part_func(**options)
+
+    except Exception as exc:
+        part_result.error = f"{type(exc).__name__}: {exc}"
+
+    return part_result
+
+
+def run_parts(
+    days: list[int],
+    parts: list[int],
+    jobs: int | None = None,
+    cache: bool = False,
+    profile: int = 0,
+    progress: bool = False,
+    **options: Any,
+) -> Iterator[PartResult]:
+    """Run day parts on a process pool, yielding results in completion order."""
+    with (
+        aggregate("solvers") if progress else nullcontext() as progress_queue,
+        ProcessPoolExecutor(max_workers=jobs) as executor,
+    ):
+        futures = [
+            executor.submit(
+                run_part,
+                day,
+                part,
+                options,
+                cache,
+                profile,
+                progress_queue,
+            )
+            for day in days
+            for part in parts
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def format_table(part_results: list[PartResult]) -> str:
+    """Return a table of part results and their stage timings in milliseconds."""
+    header = ("part", "status", *STAGE_COLUMNS, "solver", "result")
+    rows = [header]
+    for part_result in sorted(part_results, key=lambda val: (val.day, val.part)):
+        if part_result.benchmark is None:
+            blanks = [""] * (len(STAGE_COLUMNS) + 1)
+            rows.append((part_result.name, "FAIL", *blanks, part_result.error))
+            continue
+
+        benchmark = part_result.benchmark
+        stage_times = {stage.name: stage.time_ns for stage in benchmark.stages}
+        rows.append(
+            (
+                part_result.name,
+                "ok",
+                *[
+                    f"{stage_times[name] / 1e6:.2f}" if name in stage_times else "-"
+                    for name in STAGE_COLUMNS
+                ],
+                f"{benchmark.median_ns / 1e6:.2f}",
+                str(benchmark.result),
+            ),
+        )
+
+    widths = [max(len(row[idx]) for row in rows) for idx in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            val.ljust(width) for val, width in zip(row, widths, strict=True)
+        ).rstrip()
+        for row in rows
+    )
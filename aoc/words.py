@@ -0,0 +1,171 @@
+"""Search a character grid for a dictionary of words at once."""
+
+from collections import Counter
+from typing import Iterable
+
+import numpy as np
+
+# each family of lines through the grid and the direction along them
+LINE_DIRECTIONS = ((1, 0), (0, 1), (1, 1), (-1, 1))
+OTHER = 0
+
+
+class WordAutomaton:
+    """Aho-Corasick automaton of words and the words reversed."""
+
+    def __init__(self, words: Iterable[str | bytes]) -> None:
+        """
+        Build the automaton as a table of the next state for each state and letter.
+
+        words - words to find, letters not in any word all match the same code
+        """
+        self.words: list[str] = []
+        for word in words:
+            word = word.decode() if isinstance(word, bytes) else word
+            if word and word not in self.words:
+                self.words.append(word)
+
+        letters = sorted({letter for word in self.words for letter in word.encode()})
+        self.codes = np.full(256, OTHER, np.int32)
+        self.codes[letters] = np.arange(1, len(letters) + 1)
+
+        # words found backwards are found as the reversed word forwards
+        goto: list[dict[int, int]] = [{}]
+        self.outputs: list[list[tuple[int, bool]]] = [[]]
+        for word_idx, word in enumerate(self.words):
+            encoded = self.codes[list(word.encode())].tolist()
+            for pattern, backwards in (encoded, False), (encoded[::-1], True):
+                state = 0
+                for code in pattern:
+                    if code not in goto[state]:
+                        goto[state][code] = len(goto)
+                        goto.append({})
+                        self.outputs.append([])
+                    state = goto[state][code]
+                self.outputs[state].append((word_idx, backwards))
+
+        # fill in the transitions that fall back to the longest matching suffix
+        table = [[0] * (len(letters) + 1) for _ in goto]
+        fail = [0] * len(goto)
+        queue = [0]
+        for state in queue:
+            for code in range(1, len(letters) + 1):
+                if code in goto[state]:
+                    child = goto[state][code]
+                    fail[child] = table[fail[state]][code] if state else 0
+                    self.outputs[child] += self.outputs[fail[child]]
+                    table[state][code] = child
+                    queue.append(child)
+
+                else:
+                    table[state][code] = table[fail[state]][code]
+
+        self.table = np.array(table, np.int32)
+        self.has_output = np.array([bool(output) for output in self.outputs])
+
+    def scan(
+        self,
+        grid: np.ndarray,
+    ) -> list[tuple[tuple[int, int], np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Run the automaton along every line through the grid in each family.
+
+        Returns the direction of each family with the states, positions along the
+        lines and lines where words end.
+        """
+        coded = self.codes[grid]
+        height, width = coded.shape
+        y_pos, x_pos = np.mgrid[0:height, 0:width]
+        hits = []
+        for direction in LINE_DIRECTIONS:
+            # lines are columns of an array so all the lines step together, and the
+            # diagonals are skewed into columns with the gaps padded
+            if direction == (1, 0):
+                lines = np.ascontiguousarray(coded.T)
+            elif direction == (0, 1):
+                lines = coded
+            else:
+                lines = np.full((height, width + height - 1), OTHER, np.int32)
+                offsets = height - 1 - y_pos if direction == (1, 1) else y_pos
+                lines[y_pos, x_pos + offsets] = coded
+
+            states = np.zeros(lines.shape[1], np.int32)
+            hits_states, hits_pos, hits_lines = [], [], []
+            for pos, line_codes in enumerate(lines):
+                states = self.table[states, line_codes]
+                hit_lines = np.flatnonzero(self.has_output[states])
+                if len(hit_lines):
+                    hits_states.append(states[hit_lines])
+                    hits_pos.append(np.full(len(hit_lines), pos))
+                    hits_lines.append(hit_lines)
+
+            if hits_states:
+                hits.append(
+                    (
+                        direction,
+                        np.concatenate(hits_states),
+                        np.concatenate(hits_pos),
+                        np.concatenate(hits_lines),
+                    ),
+                )
+
+        return hits
+
+    def count(self, grid: np.ndarray) -> dict[str, int]:
+        """Count each word in the grid in all 8 directions."""
+        counts = dict.fromkeys(self.words, 0)
+        for _, states, _, _ in self.scan(grid):
+            for state, state_count in Counter(states.tolist()).items():
+                for word_idx, _ in self.outputs[state]:
+                    counts[self.words[word_idx]] += state_count
+
+        return counts
+
+    def find(self, grid: np.ndarray) -> dict[str, list[tuple[int, int, int, int]]]:
+        """Return the x, y coords of the start of each word and its x, y direction."""
+        height = grid.shape[0]
+        found: dict[str, list[tuple[int, int, int, int]]] = {
+            word: [] for word in self.words
+        }
+        for direction, states, positions, lines in self.scan(grid):
+            x_dir, y_dir = direction
+            for state, pos, line in zip(
+                states.tolist(),
+                positions.tolist(),
+                lines.tolist(),
+                strict=True,
+            ):
+                # the coords of the end of the word from the skewed line
+                if direction == (1, 0):
+                    x_end, y_end = pos, line
+                elif direction == (0, 1):
+                    x_end, y_end = line, pos
+                elif direction == (1, 1):
+                    x_end, y_end = line - (height - 1 - pos), pos
+                else:
+                    x_end, y_end = line - pos, pos
+
+                for word_idx, backwards in self.outputs[state]:
+                    word = self.words[word_idx]
+                    if backwards:
+                        found[word].append((x_end, y_end, -x_dir, -y_dir))
+                    else:
+                        span = len(word) - 1
+                        found[word].append(
+                            (x_end - span * x_dir, y_end - span * y_dir, x_dir, y_dir),
+                        )
+
+        return found
+
+
+def count_words(grid: np.ndarray, words: Iterable[str | bytes]) -> dict[str, int]:
+    """Count each word in the grid in all 8 directions."""
+    return WordAutomaton(words).count(grid)
+
+
+def find_words(
+    grid: np.ndarray,
+    words: Iterable[str | bytes],
+) -> dict[str, list[tuple[int, int, int, int]]]:
+    """Return the x, y coords and x, y direction of each word in the grid."""
+    return WordAutomaton(words).find(grid)
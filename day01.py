@@ -1,43 +1,468 @@
 #!/usr/bin/env python
 """AOC 2024 Day 01."""
 
+import os
+from bisect import bisect_left, bisect_right
 from collections import Counter
+from functools import partial
+from itertools import accumulate
+from math import isqrt
+from typing import Iterable, Iterator, Self
+
+import numpy as np
 
 from aoc import Runner
+from aoc.cache import uncached
+from aoc.lazy import lazy_import
+from aoc.parse import iter_ints, load_ints
+
+tempfile = lazy_import("tempfile")
 
+MEMORY_BYTES = 1 << 28
 
-def line_parser(line: str) -> list[int]:
-    """Extract data from stripped lines."""
-    return [int(val) for val in line.split(" ") if val]
 
+def load_columns(file_name: str) -> np.ndarray:
+    """Load the left and right location ids as the rows of an int64 array."""
+    values, _ = load_ints(file_name)
+    return values.reshape(-1, 2).T
 
-def get_distance(data: list[list[int]]) -> int:
+
+def get_distance(columns: np.ndarray) -> int:
     """Day 01 task 1."""
-    columns_sorted = [sorted(col) for col in zip(*data, strict=True)]
-    distances = [
-        abs(row_pair[0] - row_pair[1]) for row_pair in zip(*columns_sorted, strict=True)
-    ]
-    return sum(distances)
+    column_left, column_right = np.sort(columns, axis=1)
+    return int(np.abs(column_left - column_right).sum())
 
 
-def get_similarity(data: list[list[int]]) -> int:
+def get_similarity(columns: np.ndarray) -> int:
     """Day 01 task 2."""
-    columns = list(zip(*data, strict=True))
-    column_counter_right = Counter(columns[1])
-    similarities = [row_idx * column_counter_right[row_idx] for row_idx in columns[0]]
-    return sum(similarities)
+    column_left, column_right = columns
+    ids_right, counts_right = np.unique(column_right, return_counts=True)
+    if not len(ids_right):
+        return 0
 
+    # the count of each left id in the right column, or 0 if it isn't there
+    idx = np.searchsorted(ids_right, column_left).clip(max=len(ids_right) - 1)
+    counts = np.where(ids_right[idx] == column_left, counts_right[idx], 0)
+    return int((column_left * counts).sum())
 
-def main() -> None:
-    """Day tasks."""
-    runner = Runner(
+
+BLOCK_SIZE = 256
+
+
+class SegmentBlock:
+    """Consecutive segments of location ids with the same left minus right count."""
+
+    def __init__(
+        self,
+        starts: list[int],
+        widths: list[int],
+        counts: list[int],
+        offset: int = 0,
+    ) -> None:
+        """
+        Segments of the location ids.
+
+        starts - first location id of each segment
+        widths - number of location ids in each segment
+        counts - count of left ids less than or equal to each id less the count of
+                 right ids, less offset
+        offset - amount added to all the counts
+        """
+        self.starts = starts
+        self.widths = widths
+        self.counts = counts
+        self.offset = offset
+        self.counts_sorted: list[int] | None = None
+        self.width_sums: list[int] = []
+
+    def insert(self, idx: int, start: int, width: int, count: int) -> None:
+        """Insert a segment."""
+        self.starts.insert(idx, start)
+        self.widths.insert(idx, width)
+        self.counts.insert(idx, count - self.offset)
+        self.counts_sorted = None
+
+    def split(self) -> Self:
+        """Move the second half of the segments into a new block."""
+        half = len(self.starts) // 2
+        block = type(self)(
+            self.starts[half:],
+            self.widths[half:],
+            self.counts[half:],
+            self.offset,
+        )
+        del self.starts[half:], self.widths[half:], self.counts[half:]
+        self.counts_sorted = None
+        return block
+
+    def add(self, start: int, end: int, step: int) -> int:
+        """Add step to the counts from start to end, returning the distance change."""
+        idx_start = bisect_left(self.starts, start)
+        idx_end = bisect_left(self.starts, end)
+        if idx_start == 0 and idx_end == len(self.starts):
+            # the whole block moves so only the offset changes, and the widths that
+            # move towards zero can be found from the sorted counts
+            if self.counts_sorted is None:
+                order = sorted(range(len(self.counts)), key=self.counts.__getitem__)
+                self.counts_sorted = [self.counts[idx] for idx in order]
+                self.width_sums = list(
+                    accumulate((self.widths[idx] for idx in order), initial=0),
+                )
+            if step > 0:
+                idx = bisect_left(self.counts_sorted, -self.offset)
+                width_closer = self.width_sums[idx]
+            else:
+                idx = bisect_right(self.counts_sorted, -self.offset)
+                width_closer = self.width_sums[-1] - self.width_sums[idx]
+            self.offset += step
+            return self.width_sums[-1] - 2 * width_closer
+
+        distance_change = 0
+        for idx in range(idx_start, idx_end):
+            if (self.counts[idx] + self.offset) * step >= 0:
+                distance_change += self.widths[idx]
+            else:
+                distance_change -= self.widths[idx]
+            self.counts[idx] += step
+        self.counts_sorted = None
+        return distance_change
+
+
+class LocationLists:
+    """Location id lists that keep the distance and similarity as pairs are added."""
+
+    def __init__(self, pairs: Iterable[tuple[int, int]] = ()) -> None:
+        """
+        Start the lists with some pairs of left and right location ids.
+
+        The distance is the sum over all ids of the absolute difference between
+        the number of left and right ids less than or equal to it, as that's the
+        area between the sorted lists. Adding a pair only changes that difference
+        for the ids between them, which are kept in blocks of segments so all but
+        two blocks are updated as a whole, making adding a pair O(sqrt(n) log n).
+        """
+        self.blocks: list[SegmentBlock] = []
+        self.block_starts: list[int] = []
+        self.block_size = BLOCK_SIZE
+        self.counts_left: Counter[int] = Counter()
+        self.counts_right: Counter[int] = Counter()
+        self.distance = 0
+        self.similarity = 0
+        self._build(np.array(list(pairs), np.int64).reshape(-1, 2).T)
+
+    def _build(self, columns: np.ndarray) -> None:
+        # build the segments from the sorted columns in one go, O(n log n), rather
+        # than adding the pairs one at a time
+        if not columns.shape[1]:
+            return
+
+        column_left, column_right = np.sort(columns, axis=1)
+        ids_left, counts_left = np.unique(column_left, return_counts=True)
+        ids_right, counts_right = np.unique(column_right, return_counts=True)
+        for counter, ids, id_counts in (
+            (self.counts_left, ids_left, counts_left),
+            (self.counts_right, ids_right, counts_right),
+        ):
+            counter.update(dict(zip(ids.tolist(), id_counts.tolist(), strict=True)))
+        ids_both, idx_left, idx_right = np.intersect1d(
+            ids_left,
+            ids_right,
+            assume_unique=True,
+            return_indices=True,
+        )
+        self.similarity = int(
+            (ids_both * counts_left[idx_left] * counts_right[idx_right]).sum(),
+        )
+
+        # a segment starts at each id, with the left less right count up to it
+        starts = np.union1d(ids_left, ids_right)
+        widths = np.append(np.diff(starts), 0)
+        counts = np.searchsorted(column_left, starts, "right") - np.searchsorted(
+            column_right,
+            starts,
+            "right",
+        )
+        self.distance = int((np.abs(counts) * widths).sum())
+
+        # blocks of about sqrt(n) segments balance updating whole blocks against
+        # updating the segments of the blocks at the ends
+        self.block_size = max(BLOCK_SIZE, isqrt(len(starts)) * 2)
+        for idx in range(0, len(starts), self.block_size):
+            block_slice = slice(idx, idx + self.block_size)
+            self.blocks.append(
+                SegmentBlock(
+                    starts[block_slice].tolist(),
+                    widths[block_slice].tolist(),
+                    counts[block_slice].tolist(),
+                ),
+            )
+            self.block_starts.append(int(starts[idx]))
+
+    def __len__(self) -> int:
+        """Return the number of pairs."""
+        return self.counts_left.total()
+
+    def _start_segment(self, location_id: int) -> None:
+        if not self.blocks:
+            # the last segment runs to infinity with a count of zero, so it has
+            # no width
+            self.blocks.append(SegmentBlock([location_id], [0], [0]))
+            self.block_starts.append(location_id)
+            return
+
+        block_idx = max(bisect_right(self.block_starts, location_id) - 1, 0)
+        block = self.blocks[block_idx]
+        idx = bisect_right(block.starts, location_id) - 1
+        if idx >= 0 and block.starts[idx] == location_id:
+            return
+
+        if idx < 0:
+            # before the first segment the count is zero
+            block.insert(0, location_id, block.starts[0] - location_id, 0)
+            self.block_starts[0] = location_id
+        else:
+            start, width = block.starts[idx], block.widths[idx]
+            last = block_idx == len(self.blocks) - 1 and idx == len(block.starts) - 1
+            block.widths[idx] = location_id - start
+            block.insert(
+                idx + 1,
+                location_id,
+                0 if last else start + width - location_id,
+                block.counts[idx] + block.offset,
+            )
+
+        if len(block.starts) > self.block_size * 2:
+            block_new = block.split()
+            self.blocks.insert(block_idx + 1, block_new)
+            self.block_starts.insert(block_idx + 1, block_new.starts[0])
+
+    def add_pair(self, left: int, right: int) -> None:
+        """Add a pair of location ids."""
+        self.similarity += right * self.counts_left[right]
+        self.counts_right[right] += 1
+        self.similarity += left * self.counts_right[left]
+        self.counts_left[left] += 1
+        if left == right:
+            return
+
+        start, end = min(left, right), max(left, right)
+        self._start_segment(start)
+        self._start_segment(end)
+        step = 1 if left < right else -1
+        block_start = bisect_right(self.block_starts, start) - 1
+        block_end = bisect_left(self.block_starts, end)
+        for block in self.blocks[block_start:block_end]:
+            self.distance += block.add(start, end, step)
+
+    def add(self, pairs: Iterable[tuple[int, int]]) -> None:
+        """Add a batch of pairs of location ids."""
+        for left, right in pairs:
+            self.add_pair(left, right)
+
+
+@uncached
+class SortedRuns:
+    """Location id columns sorted in runs saved to temporary .npy files."""
+
+    def __init__(
+        self,
+        file_name: str,
+        memory_bytes: int = MEMORY_BYTES,
+        path: str | None = None,
+    ) -> None:
+        """
+        Sort a file of location ids in runs that fit in memory.
+
+        file_name - file of location id pairs
+        memory_bytes - approximate memory to use to sort and merge the runs
+        path - (optional) directory for the runs, defaults to the temp directory
+        """
+        self.memory_bytes = memory_bytes
+        # the runs are deleted with the directory when this is garbage collected
+        self.directory = tempfile.TemporaryDirectory(prefix="day01.", dir=path)
+        self.runs: tuple[list[str], list[str]] = ([], [])
+        # parsing uses about 32 bytes per byte of text, and a run of both columns
+        # takes 48 bytes per row with the parsed chunks and a sorted column
+        run_rows = max(memory_bytes // 48, 1)
+        chunks: list[np.ndarray] = []
+        chunk_rows = 0
+        for values, _ in iter_ints(file_name, max(memory_bytes // 32, 1)):
+            chunks.append(values.reshape(-1, 2))
+            chunk_rows += len(chunks[-1])
+            if chunk_rows >= run_rows:
+                self._save_run(np.concatenate(chunks))
+                chunks, chunk_rows = [], 0
+        if chunks:
+            self._save_run(np.concatenate(chunks))
+
+    def _save_run(self, rows: np.ndarray) -> None:
+        for column_idx, column in enumerate(rows.T):
+            run_file_name = os.path.join(
+                self.directory.name,
+                f"{column_idx}.{len(self.runs[column_idx])}.npy",
+            )
+            np.save(run_file_name, np.sort(column))
+            self.runs[column_idx].append(run_file_name)
+
+    def iter_sorted(self, column_idx: int) -> Iterator[np.ndarray]:
+        """Merge the runs of a column, yielding it in sorted blocks."""
+        runs = [np.load(run, mmap_mode="r") for run in self.runs[column_idx]]
+        # both columns are merged at once, and each holds the buffers, the merged
+        # block and its sorted copy
+        buffer_rows = max(self.memory_bytes // (48 * max(len(runs), 1)), 1)
+        positions = [0] * len(runs)
+        buffers = [np.zeros(0, np.int64)] * len(runs)
+        while True:
+            for idx, run in enumerate(runs):
+                if not len(buffers[idx]) and positions[idx] < len(run):
+                    buffers[idx] = np.array(
+                        run[positions[idx] : positions[idx] + buffer_rows],
+                    )
+                    positions[idx] += len(buffers[idx])
+
+            active = [idx for idx in range(len(runs)) if len(buffers[idx])]
+            if not active:
+                return
+
+            # all the ids up to the last buffered id of a run still being read are
+            # buffered, so the lowest of those can be merged up to
+            bound = min(
+                (buffers[idx][-1] for idx in active if positions[idx] < len(runs[idx])),
+                default=None,
+            )
+            blocks = []
+            for idx in active:
+                cut = (
+                    len(buffers[idx])
+                    if bound is None
+                    else np.searchsorted(buffers[idx], bound, side="right")
+                )
+                blocks.append(buffers[idx][:cut])
+                buffers[idx] = buffers[idx][cut:]
+            yield np.sort(np.concatenate(blocks))
+
+    def close(self) -> None:
+        """Delete the runs."""
+        self.directory.cleanup()
+
+
+def count_sorted(blocks: Iterable[np.ndarray]) -> Iterator[tuple[np.ndarray, ...]]:
+    """Yield the distinct ids of sorted blocks and their counts, each id only once."""
+    carry_id, carry_count = None, 0
+    for block in blocks:
+        if not len(block):
+            continue
+
+        idx_starts = np.flatnonzero(np.diff(block, prepend=block[0] - 1))
+        ids, counts = block[idx_starts], np.diff(idx_starts, append=len(block))
+        if carry_id is not None:
+            if ids[0] == carry_id:
+                counts[0] += carry_count
+            else:
+                ids = np.concatenate(([carry_id], ids))
+                counts = np.concatenate(([carry_count], counts))
+        # the last id may continue into the next block
+        carry_id, carry_count = ids[-1], counts[-1]
+        yield ids[:-1], counts[:-1]
+
+    if carry_id is not None:
+        yield np.array([carry_id]), np.array([carry_count])
+
+
+def _next_nonempty(
+    iterator: Iterator[np.ndarray] | Iterator[tuple[np.ndarray, ...]],
+) -> np.ndarray | tuple[np.ndarray, ...] | None:
+    for item in iterator:
+        if len(item[0] if isinstance(item, tuple) else item):
+            return item
+
+    return None
+
+
+def get_distance_external(runs: SortedRuns) -> int:
+    """Day 01 task 1 on sorted runs, streaming both columns."""
+    blocks_left, blocks_right = runs.iter_sorted(0), runs.iter_sorted(1)
+    block_left = block_right = np.zeros(0, np.int64)
+    distance = 0
+    while True:
+        if not len(block_left):
+            block_left = _next_nonempty(blocks_left)
+        if not len(block_right):
+            block_right = _next_nonempty(blocks_right)
+        if block_left is None or block_right is None:
+            return distance
+
+        size = min(len(block_left), len(block_right))
+        distance += int(np.abs(block_left[:size] - block_right[:size]).sum())
+        block_left, block_right = block_left[size:], block_right[size:]
+
+
+def get_similarity_external(runs: SortedRuns) -> int:
+    """Day 01 task 2 on sorted runs, merge joining the counts of each column."""
+    counts_left = count_sorted(runs.iter_sorted(0))
+    counts_right = count_sorted(runs.iter_sorted(1))
+    ids_left = ids_right = np.zeros(0, np.int64)
+    similarity = 0
+    while True:
+        if not len(ids_left):
+            next_counts = _next_nonempty(counts_left)
+            if next_counts is None:
+                return similarity
+            ids_left, column_counts_left = next_counts
+        if not len(ids_right):
+            next_counts = _next_nonempty(counts_right)
+            if next_counts is None:
+                return similarity
+            ids_right, column_counts_right = next_counts
+
+        # join the ids up to the lower of the last ids, the rest join later
+        bound = min(ids_left[-1], ids_right[-1])
+        cut_left = np.searchsorted(ids_left, bound, side="right")
+        cut_right = np.searchsorted(ids_right, bound, side="right")
+        ids, idx_left, idx_right = np.intersect1d(
+            ids_left[:cut_left],
+            ids_right[:cut_right],
+            assume_unique=True,
+            return_indices=True,
+        )
+        similarity += int(
+            (ids * column_counts_left[idx_left] * column_counts_right[idx_right]).sum(),
+        )
+        ids_left = ids_left[cut_left:]
+        column_counts_left = column_counts_left[cut_left:]
+        ids_right = ids_right[cut_right:]
+        column_counts_right = column_counts_right[cut_right:]
+
+
+def get_runner() -> Runner:
+    """Day runner."""
+    return Runner(
         1,
         get_distance,
         get_similarity,
-        line_parser=line_parser,
+        loader=load_columns,
+        expected_1=11,
+        expected_2=31,
     )
-    runner.part_1(11)
-    runner.part_2(31)
+
+
+def get_external_runner(memory_bytes: int = MEMORY_BYTES) -> Runner:
+    """Day runner for inputs larger than memory."""
+    return Runner(
+        1,
+        get_distance_external,
+        get_similarity_external,
+        loader=partial(SortedRuns, memory_bytes=memory_bytes),
+        expected_1=11,
+        expected_2=31,
+    )
+
+
+def main() -> None:
+    """Day tasks."""
+    runner = get_runner()
+    runner.part_1()
+    runner.part_2()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,16 @@
 #!/usr/bin/env python
 """AOC 2024 Day 02."""
 
+from itertools import pairwise, repeat
+from typing import Iterable
+
+import numpy as np
+
 from aoc import Runner
+from aoc.lazy import lazy_import
+from aoc.parse import CHUNK_BYTES, line_ranges, load_ints, parse_range
+
+futures = lazy_import("concurrent.futures")
 
 
 def line_parser(line: str) -> list[int]:
@@ -9,94 +18,218 @@ def line_parser(line: str) -> list[int]:
     return [int(val) for val in line.split(" ") if val]
 
 
-class Checker:
-    """Report entry pair checker."""
+STEP_MIN = 1
+STEP_MAX = 3
+
+
+def count_removals(report: list[int], tolerance: int, direction: int) -> int:
+    """
+    Return the fewest levels to remove so a report steps safely in a direction.
+
+    Keeps the fewest removals for a safe report ending at each level, which only
+    depends on the kept level before it, so it's O(n * tolerance). Returns
+    tolerance + 1 as soon as more than tolerance levels must be removed.
+
+    report - levels
+    tolerance - most levels that may be removed
+    direction - 1 for increasing levels, -1 for decreasing
+    """
+    too_many = tolerance + 1
+    removals: list[int] = []
+    removals_fewest = too_many
+    idx_last_safe = -1
+    for idx, level in enumerate(report):
+        # remove every level before this one
+        removals_level = idx if idx < too_many else too_many
+        for idx_prev in range(max(idx - too_many, 0), idx):
+            removals_prev = removals[idx_prev] + idx - idx_prev - 1
+            if (
+                removals_prev < removals_level
+                and STEP_MIN <= (level - report[idx_prev]) * direction <= STEP_MAX
+            ):
+                removals_level = removals_prev
+        removals.append(removals_level)
+
+        if removals_level < too_many:
+            idx_last_safe = idx
+            # remove every level after this one
+            removals_fewest = min(
+                removals_fewest,
+                removals_level + len(report) - idx - 1,
+            )
+        elif idx - idx_last_safe >= too_many:
+            # no later level can follow a safe one
+            return too_many
+
+    return removals_fewest if report else 0
+
+
+def is_safe(report: list[int], tolerance: int = 0) -> bool:
+    """Check if a report is safe with at most tolerance levels removed."""
+    # most reports are either safe as they are or can't be dampened
+    steps = [rhs - lhs for lhs, rhs in pairwise(report)]
+    if all(STEP_MIN <= step <= STEP_MAX for step in steps) or all(
+        -STEP_MAX <= step <= -STEP_MIN for step in steps
+    ):
+        return True
 
-    def __init__(self) -> None:
-        """Ctor."""
-        self.direction = None
+    return tolerance > 0 and any(
+        count_removals(report, tolerance, direction) <= tolerance
+        for direction in (1, -1)
+    )
 
-    def check(self, entry_pair: tuple[int, int]) -> bool:
-        """Check a pair of entries."""
-        delta = entry_pair[1] - entry_pair[0]
 
-        if delta == 0 or abs(delta) > 3:
-            # print(f"{entry_pair=} {delta=}")
-            return False
+def check_reports(data: Iterable[list[int]], tolerance: int = 0) -> int:
+    """Day 02, count the reports that are safe with up to tolerance levels removed."""
+    return sum(is_safe(report, tolerance) for report in data)
 
-        direction = delta > 0
-        if self.direction is None:
-            self.direction = direction
 
-        else:
-            if self.direction != direction:
-                # print(f"{self.direction=} {direction=}")
-                return False
+def pack_reports(
+    values: np.ndarray,
+    lines: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pack the levels of each report into the rows of an array padded with zeros.
 
-        return True
+    values - levels of all the reports
+    lines - line number of each level, blank lines are skipped
+    Returns the packed levels and the length of each report.
+    """
+    if not len(values):
+        return np.zeros((0, 0), np.int64), np.zeros(0, np.int64)
 
+    reports = np.cumsum(np.diff(lines, prepend=lines[0]) != 0)
+    lengths = np.bincount(reports)
+    positions = np.arange(len(values)) - (np.cumsum(lengths) - lengths)[reports]
+    levels = np.zeros((len(lengths), lengths.max()), np.int64)
+    levels[reports, positions] = values
+    return levels, lengths
 
-def get_dampened_reports(report: str) -> list[str]:
-    """Return a list of reports with a level removed."""
-    reports = []
-    for idx in range(len(report)):
-        dampened_report = report.copy()
-        del dampened_report[idx]
-        reports.append(dampened_report)
 
-    return reports
+def load_reports(file_name: str) -> tuple[np.ndarray, np.ndarray]:
+    """Load the reports packed into an array."""
+    return pack_reports(*load_ints(file_name))
 
 
-def check_reports(
-    data: list[str],
-    dampened: bool = False,
-) -> int:
-    """Day 02."""
-    safety_count = 0
-    dampen_max = 1 if dampened else 0
-    for report in data:
-        dampen_count = 0
-        while dampen_count <= dampen_max:
-            # build a list of reports with dampen_count levels removed
-            dampened_reports = [report]
-            for _ in range(dampen_count):
-                tmp_reports = []
-                for tmp_report in dampened_reports:
-                    tmp_reports.extend(get_dampened_reports(tmp_report))
-
-                dampened_reports = tmp_reports
-
-            dampen_count += 1
-
-            # check reports until a safe one is found
-            safe = False
-            for dampened_report in dampened_reports:
-                checker = Checker()
-                checks = map(
-                    checker.check,
-                    zip(dampened_report, dampened_report[1:], strict=False),
-                )
-                if all(checks):
-                    safety_count += 1
-                    safe = True
-                    break
-
-            if safe:
-                break
-
-    return safety_count
+def _steps_safe(
+    levels: np.ndarray,
+    lengths: np.ndarray,
+    gap: int,
+    direction: int,
+) -> np.ndarray:
+    # steps between levels gap apart, steps past the end of a report are safe
+    steps = (levels[:, gap:] - levels[:, :-gap]) * direction
+    idx_end = np.arange(gap, levels.shape[1])
+    return ((steps >= STEP_MIN) & (steps <= STEP_MAX)) | (idx_end >= lengths[:, None])
 
 
-def main() -> None:
-    """Day tasks."""
-    runner = Runner(
+def count_safe_packed(
+    reports: tuple[np.ndarray, np.ndarray],
+    tolerance: int = 0,
+) -> int:
+    """Day 02, count the safe packed reports with up to one level removed."""
+    if tolerance > 1:
+        raise ValueError("packed reports can only have one level removed")
+
+    levels, lengths = reports
+    rows, width = levels.shape
+    if not rows:
+        return 0
+
+    idx = np.arange(width)
+    ones = np.ones((rows, 1), bool)
+    safe = np.zeros(rows, bool)
+    for direction in (1, -1):
+        steps_safe = _steps_safe(levels, lengths, 1, direction)
+        safe |= steps_safe.all(axis=1)
+        if not tolerance:
+            continue
+
+        # removing level idx leaves the steps before idx - 1 and from idx + 1, and
+        # a step over idx between its neighbours
+        before = np.hstack([ones, np.logical_and.accumulate(steps_safe, axis=1)])
+        after = np.hstack(
+            [np.logical_and.accumulate(steps_safe[:, ::-1], axis=1)[:, ::-1], ones],
+        )
+        over = np.ones((rows, width), bool)
+        over[:, 1 : width - 1] = _steps_safe(levels, lengths, 2, direction)
+        safe |= (
+            before[:, np.maximum(idx - 1, 0)]
+            & over
+            & after[:, np.minimum(idx + 1, width - 1)]
+            & (idx < lengths[:, None])
+        ).any(axis=1)
+
+    return int(safe.sum())
+
+
+def count_safe_range(file_name: str, byte_range: range, tolerance: int = 0) -> int:
+    """Count the safe reports in a byte range of a file."""
+    reports = pack_reports(*parse_range(file_name, byte_range))
+    return count_safe_packed(reports, tolerance)
+
+
+def check_file(
+    file_name: str,
+    tolerance: int = 0,
+    jobs: int | None = None,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> int:
+    """
+    Count the safe reports in a file of any size, in chunks on a process pool.
+
+    file_name - file of reports
+    tolerance - levels that may be removed, 0 or 1
+    jobs - (optional) worker processes, defaults to the number of CPUs
+    chunk_bytes - approximate size of the chunk of whole lines each worker checks
+    """
+    ranges = line_ranges(file_name, chunk_bytes)
+    if jobs == 1 or len(ranges) <= 1:
+        return sum(
+            count_safe_range(file_name, byte_range, tolerance) for byte_range in ranges
+        )
+
+    with futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        return sum(
+            executor.map(
+                count_safe_range,
+                repeat(file_name),
+                ranges,
+                repeat(tolerance),
+            ),
+        )
+
+
+def get_runner() -> Runner:
+    """Day runner."""
+    return Runner(
         2,
         check_reports,
-        extra_args_2=[True],
+        extra_args_2=[1],
         line_parser=line_parser,
+        expected_1=2,
+        expected_2=4,
+        stream=True,
+    )
+
+
+def get_batch_runner() -> Runner:
+    """Day runner checking all the reports at once with numpy."""
+    return Runner(
+        2,
+        count_safe_packed,
+        extra_args_2=[1],
+        loader=load_reports,
+        expected_1=2,
+        expected_2=4,
     )
-    runner.part_1(2)
-    runner.part_2(4)
+
+
+def main() -> None:
+    """Day tasks."""
+    runner = get_runner()
+    runner.part_1()
+    runner.part_2()
 
 
 if __name__ == "__main__":
@@ -1,39 +1,49 @@
 #!/usr/bin/env python
 """AOC 2024 Day 03."""
 
+import os
 import re
+from collections.abc import Buffer
+from functools import partial
+from itertools import repeat
+from typing import Iterable, NamedTuple
 
-from aoc import Runner
+from aoc import FileChunks, Runner
+from aoc.lazy import lazy_import
 
+futures = lazy_import("concurrent.futures")
 
-def load_data(file_name: str) -> str:
-    """Load all the data as a single string."""
-    with open(file_name) as file_object:
-        return file_object.read()
+MUL_PATTERN = re.compile(rb"mul\((?P<lhs>\d+),(?P<rhs>\d+)\)")
+INSTRUCTION_PATTERN = re.compile(
+    rb"(do\(\)|don't\(\)|mul\((?P<lhs>\d+),(?P<rhs>\d+)\))",
+)
+# the start of an instruction that the next chunk may complete
+PARTIAL_PATTERN = re.compile(
+    rb"(?:m(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?|d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?)\Z",
+)
+# the rest of an instruction that the previous chunk may have started, which
+# can't contain the start of an instruction as no instruction has m or d in it
+# after its first letter
+HEAD_PATTERN = re.compile(rb"[\d,ul(on't]*\)?")
 
 
-def cleanse_instructions_1(data: str) -> int:
-    """Cleanse and run corrupted instructions 1."""
-    instructions = re.findall(r"mul\((?P<lhs>\d+),(?P<rhs>\d+)\)", data, re.M)
-
-    return sum(map(lambda val: int(val[0]) * int(val[1]), instructions))
-
-
-def cleanse_instructions_2(data: str) -> int:
-    """Cleanse and run corrupted instructions 2."""
-    matches = re.findall(
-        r"(do\(\)|don't\(\)|mul\((?P<lhs>\d+),(?P<rhs>\d+)\))",
-        data,
-        re.M,
+def cleanse_instructions_1(data: Buffer) -> int:
+    """Cleanse and run corrupted instructions 1 from bytes or a memory map."""
+    return sum(
+        int(match["lhs"]) * int(match["rhs"]) for match in MUL_PATTERN.finditer(data)
     )
 
+
+def cleanse_instructions_2(data: Buffer) -> int:
+    """Cleanse and run corrupted instructions 2 from bytes or a memory map."""
     do = True
     total = 0
-    for instruction, lhs, rhs in matches:
-        if instruction == "do()":
+    for match in INSTRUCTION_PATTERN.finditer(data):
+        instruction, lhs, rhs = match.groups()
+        if instruction == b"do()":
             do = True
 
-        elif instruction == "don't()":
+        elif instruction == b"don't()":
             do = False
 
         else:
@@ -43,17 +53,225 @@ def cleanse_instructions_2(data: str) -> int:
     return total
 
 
-def main() -> None:
-    """Day tasks."""
-    runner = Runner(
+def partial_instruction(buffer: bytes, start: int = 0) -> bytes:
+    """Return the start of an instruction at the end of the buffer, if any."""
+    # a partial instruction has one m or d at its start, so only the last of each
+    # needs checking
+    for idx in sorted((buffer.rfind(b"m", start), buffer.rfind(b"d", start))):
+        if idx >= 0 and PARTIAL_PATTERN.match(buffer, idx):
+            return buffer[idx:]
+
+    return b""
+
+
+class Scanner:
+    """Run corrupted instructions a chunk at a time."""
+
+    def __init__(self, conditional: bool = False, enabled: bool = True) -> None:
+        """
+        Scan instructions, carrying any partial instruction to the next chunk.
+
+        conditional - follow do() and don't() instructions
+        enabled - whether mul instructions are enabled at the start
+        """
+        self.pattern = INSTRUCTION_PATTERN if conditional else MUL_PATTERN
+        self.enabled = enabled
+        self.total = 0
+        self.carry = b""
+
+    def feed(self, chunk: bytes) -> None:
+        """Run the complete instructions so far."""
+        buffer = self.carry + chunk if self.carry else chunk
+        end = 0
+        for match in self.pattern.finditer(buffer):
+            end = match.end()
+            instruction = match[0]
+            if instruction == b"do()":
+                self.enabled = True
+
+            elif instruction == b"don't()":
+                self.enabled = False
+
+            elif self.enabled:
+                self.total += int(match["lhs"]) * int(match["rhs"])
+
+        self.carry = partial_instruction(buffer, end)
+
+
+def scan_instructions(chunks: Iterable[bytes], conditional: bool = False) -> int:
+    """Cleanse and run corrupted instructions from chunks of bytes."""
+    scanner = Scanner(conditional)
+    for chunk in chunks:
+        scanner.feed(chunk)
+
+    return scanner.total
+
+
+class RangeSummary(NamedTuple):
+    """Instructions run in a range of bytes, which can be combined in order."""
+
+    head: bytes
+    head_only: bool
+    tail: bytes
+    total: int
+    total_enabled: int
+    total_disabled: int
+    enabled: bool | None
+
+
+def summarise_bytes(data: bytes) -> RangeSummary:
+    """
+    Run the complete instructions in some bytes from the middle of the memory.
+
+    Returns the bytes at the start that may finish an instruction from before, and
+    whether that's all of them, the start of an instruction at the end, the totals
+    of all the mul instructions and of those enabled if mul instructions are
+    enabled or disabled at the start, and the state at the end if it's set.
+    """
+    head = HEAD_PATTERN.match(data)[0]
+    total = total_enabled = total_disabled = 0
+    enabled = None
+    end = 0
+    for match in INSTRUCTION_PATTERN.finditer(data):
+        end = match.end()
+        instruction = match[0]
+        if instruction == b"do()":
+            enabled = True
+
+        elif instruction == b"don't()":
+            enabled = False
+
+        else:
+            product = int(match["lhs"]) * int(match["rhs"])
+            total += product
+            if enabled is None:
+                total_enabled += product
+
+            elif enabled:
+                total_enabled += product
+                total_disabled += product
+
+    return RangeSummary(
+        head,
+        len(head) == len(data),
+        partial_instruction(data, end),
+        total,
+        total_enabled,
+        total_disabled,
+        enabled,
+    )
+
+
+def summarise_range(file_name: str, byte_range: range) -> RangeSummary:
+    """Run the complete instructions in a range of bytes of a file."""
+    with open(file_name, "rb") as file_object:
+        file_object.seek(byte_range.start)
+        return summarise_bytes(file_object.read(len(byte_range)))
+
+
+def summarise_file(
+    file_name: str,
+    jobs: int | None = None,
+    chunk_bytes: int = 1 << 24,
+) -> list[RangeSummary]:
+    """
+    Summarise ranges of a file in parallel.
+
+    file_name - file of corrupted memory
+    jobs - (optional) worker processes, defaults to the number of CPUs
+    chunk_bytes - size of the range each worker runs
+    """
+    file_size = os.path.getsize(file_name)
+    ranges = [
+        range(start, min(start + chunk_bytes, file_size))
+        for start in range(0, file_size, chunk_bytes)
+    ]
+    if jobs == 1 or len(ranges) <= 1:
+        return list(map(summarise_range, repeat(file_name), ranges))
+
+    with futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(summarise_range, repeat(file_name), ranges))
+
+
+def combine_summaries(
+    summaries: Iterable[RangeSummary],
+    conditional: bool = False,
+) -> int:
+    """Cleanse and run corrupted instructions from the summaries of each range."""
+    total = 0
+    enabled = True
+    carry = b""
+    for summary in summaries:
+        if carry:
+            # finish any instruction started in the ranges before
+            scanner = Scanner(conditional, enabled)
+            scanner.carry = carry
+            scanner.feed(summary.head)
+            total += scanner.total
+            enabled = scanner.enabled
+            carry = scanner.carry if summary.head_only else b""
+
+        if not conditional:
+            total += summary.total
+
+        else:
+            total += summary.total_enabled if enabled else summary.total_disabled
+            if summary.enabled is not None:
+                enabled = summary.enabled
+
+        if not summary.head_only:
+            carry = summary.tail
+
+    return total
+
+
+def get_runner() -> Runner:
+    """Day runner."""
+    return Runner(
         3,
         cleanse_instructions_1,
         cleanse_instructions_2,
         split_test_data=True,
-        loader=load_data,
+        memory_map=True,
+        expected_1=161,
+        expected_2=48,
+    )
+
+
+def get_chunked_runner(chunk_bytes: int = 1 << 20) -> Runner:
+    """Day runner reading the instructions a chunk at a time."""
+    return Runner(
+        3,
+        scan_instructions,
+        extra_args_2=[True],
+        split_test_data=True,
+        loader=partial(FileChunks, chunk_bytes=chunk_bytes),
+        expected_1=161,
+        expected_2=48,
     )
-    runner.part_1(161)
-    runner.part_2(48)
+
+
+def get_parallel_runner(
+    jobs: int | None = None,
+    chunk_bytes: int = 1 << 24,
+) -> Runner:
+    """Day runner summarising ranges of the instructions in parallel."""
+    return Runner(
+        3,
+        combine_summaries,
+        extra_args_2=[True],
+        split_test_data=True,
+        loader=partial(summarise_file, jobs=jobs, chunk_bytes=chunk_bytes),
+        expected_1=161,
+        expected_2=48,
+    )
+
+
+def main() -> None:
+    """Day tasks."""
+    runner = get_runner()
+    runner.part_1()
+    runner.part_2()
 
 
 if __name__ == "__main__":
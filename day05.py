@@ -2,6 +2,7 @@
 """AOC 2024 Day 05."""
 
 from aoc import Runner
+from aoc.shared import mutates_data
 
 
 def load_parser(data: list[str]) -> tuple[dict[int, list[int]], list[list[int]]]:
@@ -54,6 +55,7 @@ def fix_update(rules: dict[int, list[int]], update: list[int]) -> list[int]:
     return [rule_key] + fix_update(rules, update[1:])
 
 
+@mutates_data
 def check_page_order(
     data: tuple[dict[int, list[int]], list[list[int]]],
     part_one: bool = True,
@@ -77,16 +79,23 @@ def check_page_order(
     return total
 
 
-def main() -> None:
-    """Day tasks."""
-    runner = Runner(
+def get_runner() -> Runner:
+    """Day runner."""
+    return Runner(
         5,
         check_page_order,
         load_parser=load_parser,
         extra_args_2=[False],
+        expected_1=143,
+        expected_2=123,
     )
-    runner.part_1(143)
-    runner.part_2(123)
+
+
+def main() -> None:
+    """Day tasks."""
+    runner = get_runner()
+    runner.part_1()
+    runner.part_2()
 
 
 if __name__ == "__main__":
@@ -2,9 +2,11 @@
 """AOC 2024 Day 06."""
 
 import numpy as np
-from tqdm import tqdm
 
 from aoc import Runner
+from aoc.grid import find_chars, load_grid
+from aoc.progress import progress
+from aoc.shared import mutates_data
 
 GUARD_DIR = [
     (0, 1),
@@ -12,21 +14,21 @@ GUARD_DIR = [
     (0, -1),
     (1, 0),
 ]
-GUARD_CHARS = "v<^>"
+GUARD_CHARS = b"v<^>"
+FLOOR = ord(".")
+OBSTRUCTION = ord("#")
 
 
-def load_map(file_name: str) -> tuple[list[list[str]], tuple[int, int], int]:
+def load_map(file_name: str) -> tuple[np.ndarray, tuple[int, int], int]:
     """Load the map and find the guard."""
-    map = np.genfromtxt(file_name, dtype="U1", ndmin=2, delimiter=1, comments="-")
+    map = load_grid(file_name)
 
-    y_max, x_max = map.shape
-    for y_pos in range(y_max):
-        for x_pos in range(x_max):
-            guard_char = map[y_pos, x_pos]
-            if guard_char in GUARD_CHARS:
-                return map, (x_pos, y_pos), GUARD_CHARS.index(guard_char)
+    guards = find_chars(map, GUARD_CHARS)
+    if not guards:
+        raise ValueError("guard not found")
 
-    raise ValueError("guard not found")
+    x_pos, y_pos = guards[0]
+    return map, (x_pos, y_pos), GUARD_CHARS.index(map[y_pos, x_pos])
 
 
 def out_of_bounds(pos: tuple[int, int], size: tuple[int, int]) -> bool:
@@ -53,7 +55,7 @@ def get_next_guard_pos(
         if out_of_bounds((x_pos, y_pos), (x_max, y_max)):
             return None, None
 
-        if map[y_pos, x_pos] != "#":
+        if map[y_pos, x_pos] != OBSTRUCTION:
             return (x_pos, y_pos), guard_dir
 
         guard_dir += 1
@@ -61,7 +63,7 @@ def get_next_guard_pos(
             guard_dir = 0
 
 
-def count_guard_steps(data: tuple[list[list[str]], tuple[int, int], int]) -> int:
+def count_guard_steps(data: tuple[np.ndarray, tuple[int, int], int]) -> int:
     """Count how many locations explored before the guard leaves the map."""
     map, guard_pos, guard_dir = data
 
@@ -76,22 +78,22 @@ def count_guard_steps(data: tuple[list[list[str]], tuple[int, int], int]) -> int
     return len(pos_set)
 
 
-def count_guard_loops(data: tuple[list[list[str]], tuple[int, int], int]) -> int:
+@mutates_data
+def count_guard_loops(data: tuple[np.ndarray, tuple[int, int], int]) -> int:
     """Count how many times adding an obstruction puts the guard in a loop."""
     map, guard_pos_init, guard_dir_init = data
 
     total = 0
     y_max, x_max = map.shape
-    with tqdm(total=y_max * x_max) as pbar:
+    with progress(total=y_max * x_max) as pbar:
         for y_pos in range(y_max):
+            pbar.update(x_max)
             for x_pos in range(x_max):
-                pbar.update()
-
-                if map[y_pos, x_pos] != ".":
+                if map[y_pos, x_pos] != FLOOR:
                     continue
 
                 # set the obstruction
-                map[y_pos, x_pos] = "#"
+                map[y_pos, x_pos] = OBSTRUCTION
 
                 # reset the guard
                 guard_pos = guard_pos_init
@@ -113,21 +115,28 @@ def count_guard_loops(data: tuple[list[list[str]], tuple[int, int], int]) -> int
                         break
 
                 # reset the obstruction
-                map[y_pos, x_pos] = "."
+                map[y_pos, x_pos] = FLOOR
 
     return total
 
 
-def main() -> None:
-    """Day tasks."""
-    runner = Runner(
+def get_runner() -> Runner:
+    """Day runner."""
+    return Runner(
         6,
         count_guard_steps,
         count_guard_loops,
         loader=load_map,
+        expected_1=41,
+        expected_2=6,
     )
-    runner.part_1(41)
-    runner.part_2(6)
+
+
+def main() -> None:
+    """Day tasks."""
+    runner = get_runner()
+    runner.part_1()
+    runner.part_2()
 
 
 if __name__ == "__main__":
@@ -2,11 +2,10 @@
 """AOC 2024 Day 07."""
 
 from operator import add, mul
-from typing import Callable
-
-from tqdm import tqdm
+from typing import Callable, Iterable
 
 from aoc import Runner
+from aoc.progress import progress
 
 
 def line_parser(line: str) -> list[int]:
@@ -38,32 +37,38 @@ def calculate(
 
 
 def calibrate(
-    data: list[int],
+    data: Iterable[list[int]],
     operators: list[Callable],
 ) -> int:
-    """Sum all the target numbers that can be calculated."""
+    """Sum all the target numbers that can be calculated in a single pass."""
     return sum(
-        [
-            line[0] if calculate(line[0], line[1], line[2:], operators) else 0
-            for line in tqdm(data)
-        ],
+        line[0] if calculate(line[0], line[1], line[2:], operators) else 0
+        for line in progress(data)
     )
 
 
-def main() -> None:
-    """Day tasks."""
+def get_runner() -> Runner:
+    """Day runner."""
     operators_part1 = [add, mul]
     operators_part2 = [add, mul, lambda lhs, rhs: int(str(lhs) + str(rhs))]
 
-    runner = Runner(
+    return Runner(
         7,
         calibrate,
         extra_args_1=[operators_part1],
         extra_args_2=[operators_part2],
         line_parser=line_parser,
+        expected_1=3749,
+        expected_2=11387,
+        stream=True,
     )
-    runner.part_1(3749)
-    runner.part_2(11387)
+
+
+def main() -> None:
+    """Day tasks."""
+    runner = get_runner()
+    runner.part_1()
+    runner.part_2()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,9 @@ from typing import Iterator, Self
 import numpy as np
 
 from aoc import Runner
+from aoc.grid import find_chars, load_grid
+
+EMPTY = ord(".")
 
 
 @dataclass(frozen=True)
@@ -38,17 +41,17 @@ class Coordinate:
 
 def load_map(file_name: str) -> tuple[dict[str, Coordinate], Coordinate]:
     """Load the map and find the antennas."""
-    map = np.genfromtxt(file_name, dtype="U1", ndmin=2, delimiter=1, comments="-")
+    map = load_grid(file_name)
+
+    antenna_to_coord_lookup = {
+        chr(antenna): {
+            Coordinate(x_pos, y_pos) for x_pos, y_pos in find_chars(map, int(antenna))
+        }
+        for antenna in np.unique(map)
+        if antenna != EMPTY
+    }
 
-    antenna_to_coord_lookup = {}
     y_max, x_max = map.shape
-    for y_pos in range(y_max):
-        for x_pos in range(x_max):
-            val = str(map[y_pos, x_pos])
-            if val != ".":
-                coord_set = antenna_to_coord_lookup.setdefault(val, set())
-                coord_set.add(Coordinate(x_pos, y_pos))
-
     return antenna_to_coord_lookup, Coordinate(x_max, y_max)
 
 
@@ -108,16 +111,23 @@ def count_antinodes_including_harmonics(
     return len(antinodes)
 
 
-def main() -> None:
-    """Day tasks."""
-    runner = Runner(
+def get_runner() -> Runner:
+    """Day runner."""
+    return Runner(
         8,
         count_antinodes,
         count_antinodes_including_harmonics,
         loader=load_map,
+        expected_1=14,
+        expected_2=34,
     )
-    runner.part_1(14)
-    runner.part_2(34)
+
+
+def main() -> None:
+    """Day tasks."""
+    runner = get_runner()
+    runner.part_1()
+    runner.part_2()
 
 
 if __name__ == "__main__":
@@ -4,11 +4,12 @@
 from itertools import chain, count, repeat
 from typing import Iterator
 
-from tqdm import tqdm
-
-from aoc import Runner
+from aoc import Runner, map_file
+from aoc.progress import progress
+from aoc.shared import mutates_data
 
 FREE_SPACE_ID = -1
+DIGIT_ZERO = ord("0")
 
 
 def block_generator() -> Iterator[int]:
@@ -18,22 +19,23 @@ def block_generator() -> Iterator[int]:
         yield free_space_id
 
 
-def map_generator(map: str) -> Iterator[int]:
-    """Generate the disk map as a list of ints."""
+def map_generator(map: memoryview) -> Iterator[int]:
+    """Generate the disk map as ints from the block description digit bytes."""
     return chain.from_iterable(
-        [
-            int(code) * [file_id]
-            for code, file_id in zip(map, block_generator(), strict=False)
-        ],
+        (code - DIGIT_ZERO) * [file_id]
+        for code, file_id in zip(map, block_generator(), strict=False)
     )
 
 
 def load_map(file_name: str) -> list[int]:
-    """Load the disk block description and generate the disk map."""
-    with open(file_name) as file_object:
-        block_description = file_object.readline().rstrip()
+    """Load the memory mapped disk block description and generate the disk map."""
+    block_description = map_file(file_name)
+    line_end = block_description.find(b"\n")
+    if line_end < 0:
+        line_end = len(block_description)
 
-    return list(map_generator(block_description))
+    with memoryview(block_description)[:line_end] as digits:
+        return list(map_generator(digits))
 
 
 def calculate_checksum(disk_map: list[int]) -> int:
@@ -47,6 +49,7 @@ def calculate_checksum(disk_map: list[int]) -> int:
     )
 
 
+@mutates_data
 def defrag_blocks(disk_map: list[int]) -> int:
     """Defrag the disk map and calculate the checksum."""
     start = 0
@@ -97,10 +100,11 @@ def _defrag_file(
         start += free_space_size
 
 
+@mutates_data
 def defrag_files(disk_map: list[int]) -> int:
     """Defrag the disk map and calculate the checksum."""
     end = len(disk_map) - 1
-    with tqdm(total=end) as pbar:
+    with progress(total=end) as pbar:
         start = 0
         while True:
             while disk_map[start] != FREE_SPACE_ID and start != end:
@@ -126,16 +130,23 @@ def defrag_files(disk_map: list[int]) -> int:
     return calculate_checksum(disk_map)
 
 
-def main() -> None:
-    """Day tasks."""
-    runner = Runner(
+def get_runner() -> Runner:
+    """Day runner."""
+    return Runner(
         9,
         defrag_blocks,
         defrag_files,
         loader=load_map,
+        expected_1=1928,
+        expected_2=2858,
     )
-    runner.part_1(1928)
-    runner.part_2(2858)
+
+
+def main() -> None:
+    """Day tasks."""
+    runner = get_runner()
+    runner.part_1()
+    runner.part_2()
 
 
 if __name__ == "__main__":
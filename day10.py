@@ -6,22 +6,17 @@ from typing import Optional, Union
 import numpy as np
 
 from aoc import Runner
+from aoc.grid import find_chars, load_grid
 
 
 def load_map(file_name: str) -> np.ndarray:
     """Load the disk block description and generate the disk map."""
-    return np.genfromtxt(file_name, dtype=np.byte, ndmin=2, delimiter=1, comments="-")
+    return load_grid(file_name, digits=True)
 
 
 def find_heads(map: np.ndarray) -> list[tuple[int, int]]:
     """Find all trail head coords in the map."""
-    heads = []
-    it = np.nditer(map, flags=["multi_index"])
-    while not it.finished:
-        if it[0] == 0:
-            heads.append((it.multi_index[1], it.multi_index[0]))
-        it.iternext()
-    return heads
+    return find_chars(map, 0)
 
 
 def walk_trail(
@@ -84,16 +79,23 @@ def sum_trail_ratings(map: np.ndarray) -> int:
     return sum([len(walk_trail(map, head, ratings=True)) for head in heads])
 
 
-def main() -> None:
-    """Day tasks."""
-    runner = Runner(
+def get_runner() -> Runner:
+    """Day runner."""
+    return Runner(
         10,
         sum_trail_heads,
         sum_trail_ratings,
         loader=load_map,
+        expected_1=36,
+        expected_2=81,
     )
-    runner.part_1(36)
-    runner.part_2(81)
+
+
+def main() -> None:
+    """Day tasks."""
+    runner = get_runner()
+    runner.part_1()
+    runner.part_2()
 
 
 if __name__ == "__main__":
@@ -42,20 +42,28 @@ def blink(stone: int, times: int) -> int:
 
 def keep_blinking(stones: list[int], times: int) -> int:
     """Blink a number of times at the stones."""
+    # start from an empty cache so repeated benchmark runs are comparable
+    blink.cache_clear()
     return sum([blink(stone, times) for stone in stones])
 
 
-def main() -> None:
-    """Day tasks."""
-    runner = Runner(
+def get_runner() -> Runner:
+    """Day runner."""
+    return Runner(
         11,
         keep_blinking,
         extra_args_1=[25],
         extra_args_2=[75],
         line_parser=lambda line: [int(val) for val in line.split(" ")],
         load_parser=lambda data: data[0],
+        expected_1=55312,
     )
-    runner.part_1(55312)
+
+
+def main() -> None:
+    """Day tasks."""
+    runner = get_runner()
+    runner.part_1()
     runner.part_2()
 
 
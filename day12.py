@@ -3,7 +3,7 @@
 
 from dataclasses import dataclass, field
 from itertools import count
-from typing import Self
+from typing import Iterable, Self
 
 from aoc import Runner
 
@@ -79,10 +79,9 @@ class Plot:
 class MapCalculator:
     """Calculate costs for the map."""
 
-    def __init__(self, width: int, height: int, part_one: bool = True) -> None:
+    def __init__(self, part_one: bool = True) -> None:
         """Ctor."""
-        self.width = width
-        self.height = height
+        self.width = 0
         self.part_one = part_one
         self.row_idx = 0
         self.plot_id = 0
@@ -163,11 +162,9 @@ class MapCalculator:
                     SideCoordinate(col_idx, self.row_idx, True, False),
                 )
 
-            if self.row_idx == self.height - 1:
-                plot.side_coords.add(SideCoordinate(col_idx, self.height, True, False))
-
     def calculate_row(self, row: str) -> None:
         """Update the map calculations from another row."""
+        self.width = len(row)
         self.row_plots = []
         for idx, block in enumerate(row):
             self._add_row_block(idx, block)
@@ -176,6 +173,11 @@ class MapCalculator:
 
         self.row_plots_last = self.row_plots
 
+    def finish(self) -> None:
+        """Add the sides below the last row, the map height is unknown until now."""
+        for col_idx, plot in enumerate(self.row_plots_last):
+            plot.side_coords.add(SideCoordinate(col_idx, self.row_idx, True, False))
+
     def cost(self) -> int:
         """Return the calculated cost."""
         return sum(
@@ -186,15 +188,17 @@ class MapCalculator:
         )
 
 
-def calculate_map(map: list[str], part_one: bool = True) -> int:
-    """Calculate the cost of the map."""
-    calc = MapCalculator(len(map[0]), len(map), part_one)
+def calculate_map(map: Iterable[str], part_one: bool = True) -> int:
+    """Calculate the cost of the map a row at a time."""
+    calc = MapCalculator(part_one)
 
     # print()
     for row in map:
         calc.calculate_row(row)
         # print(" ".join([f"{plot.id}:{plot.block}" for plot in calc.row_plots]))
 
+    calc.finish()
+
     # for _, plot in calc.plot_lookup.items():
     #     multiplier = plot.area if calc.part_one else plot.sides
     #     print(f"{plot.block} {plot.area} * {multiplier}")
@@ -202,6 +206,18 @@ def calculate_map(map: list[str], part_one: bool = True) -> int:
     return calc.cost()
 
 
+def get_runner() -> Runner:
+    """Day runner."""
+    return Runner(
+        12,
+        calculate_map,
+        extra_args_2=[False],
+        expected_1=1930,
+        expected_2=1206,
+        stream=True,
+    )
+
+
 def main() -> None:
     """Day tasks."""
     # for map in [
@@ -221,20 +237,17 @@ def main() -> None:
     #         "AAAAAA",
     #     ],
     # ]:
-    #     calc = MapCalculator(len(map[0]), len(map), False)
+    #     calc = MapCalculator(False)
     #     for row in map:
     #         calc.calculate_row(row)
+    #     calc.finish()
     #     print(calc.cost())
     #     for plot in calc.plot_lookup.values():
     #         print(f"{plot.id=} {plot.block=} {plot.sides=}")
 
-    runner = Runner(
-        12,
-        calculate_map,
-        extra_args_2=[False],
-    )
-    runner.part_1(1930)
-    runner.part_2(1206)
+    runner = get_runner()
+    runner.part_1()
+    runner.part_2()
 
 
 if __name__ == "__main__":